@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Make the package importable from a source checkout when running plain ``pytest``
+sys.path.insert(0, str(Path(__file__).parent.parent))
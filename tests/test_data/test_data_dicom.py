@@ -1,19 +1,20 @@
-import os
-import sys
+from datetime import date
 from unittest import mock
 
 import numpy as np
 import pydicom
+import pytest
 from loguru import logger
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-sys.path.append(os.path.realpath(f"{dir_path}/../../../turtwig"))
-
 from turtwig.data import (compute_dataset_stats, load_all_masks,
-                          load_all_patient_scans, load_mask, load_patient_scan,
-                          load_roi_names, load_volume, purge_dicom_dir)
-from turtwig.data.dicom import CT_IMAGE, RT_STRUCTURE_SET, _load_rt_structs
-from turtwig.futils import curry
+                          load_all_patient_scans, load_all_volumes, load_mask,
+                          load_patient_scan, load_roi_names, load_volume,
+                          purge_dicom_dir)
+from turtwig.data.dicom import (CT_IMAGE, RT_STRUCTURE_SET,
+                                _get_uniform_spacing, _load_each_patient,
+                                _load_rt_structs, _parse_dicom_date,
+                                _sort_by_slice_order)
+from turtwig.futils import curry, pmap
 
 path_id = 0
 
@@ -24,16 +25,38 @@ def gen_path():
     return f"path/to/folder{path_id}"
 
 
+def write_ct_slice(path, z, pixels):
+    """Write a CT slice at depth ``z`` with ``pixels`` that pydicom can decode"""
+    ds = pydicom.Dataset()
+    ds.file_meta = pydicom.dataset.FileMetaDataset()
+    ds.file_meta.TransferSyntaxUID = pydicom.uid.ImplicitVRLittleEndian
+    ds.SOPClassUID = CT_IMAGE
+    ds.PixelSpacing = [1.0, 1.0]
+    ds.SliceThickness = 1.0
+    ds.ImageOrientationPatient = [1.0, 0.0, 0.0, 0.0, 1.0, 0.0]
+    ds.ImagePositionPatient = [0.0, 0.0, float(z)]
+    ds.RescaleSlope = 1.0
+    ds.RescaleIntercept = -1024.0
+    ds.Rows, ds.Columns = pixels.shape
+    ds.SamplesPerPixel = 1
+    ds.PhotometricInterpretation = "MONOCHROME2"
+    ds.BitsAllocated = 16
+    ds.BitsStored = 16
+    ds.HighBit = 15
+    ds.PixelRepresentation = 0
+    ds.PixelData = pixels.astype(np.uint16).tobytes()
+    ds.save_as(path, implicit_vr=True)
+
+
 # Patch paths
 PATCH_LIST_FILES = "turtwig.data.dicom.list_files"
 PATCH_DCMREAD = "pydicom.dcmread"
 PATCH_RT_CREATE_FROM = "rt_utils.RTStructBuilder.create_from"
 PATCH_LOAD_RT_STRUCTS = "turtwig.data.dicom._load_rt_structs"
-PATCH_LOAD_VOLUME = "turtwig.data.dicom.load_volume"
-PATCH_LOAD_MASK = "turtwig.data.dicom.load_mask"
-PATCH_GENERATE_FULL_PATHS = "turtwig.data.dicom.generate_full_paths"
+PATCH_LOAD_VOLUME_FROM_SLICES = "turtwig.data.dicom._load_volume_from_slices"
+PATCH_LOAD_MASK = "turtwig.data.dicom._load_mask"
+PATCH_GENERATE_SUBDIRS = "turtwig.data.dicom.generate_subdirs"
 PATCH_LOAD_PATIENT_SCAN = "turtwig.data.dicom.load_patient_scan"
-PATCH_LISTDIR = "os.listdir"
 PATCH_GET_DICOM_SLICES = "turtwig.data.dicom._get_dicom_slices"
 
 MOCK_DICOM = mock.Mock()
@@ -74,6 +97,62 @@ class TestLoadVolume:
         # Assert the volume shape is as expected
         assert volume.shape == (512, 412, 4)
 
+    # converts pixel values to Hounsfield units using the rescale slope and intercept
+    def test_applies_rescale_slope_and_intercept(self, mocker):
+        mocker.patch(PATCH_LIST_FILES, return_value=["file1.dcm", "file2.dcm"])
+        mock_dicom = mock.Mock()
+        mock_dicom.SOPClassUID = CT_IMAGE
+        mock_dicom.SliceThickness = 2.0
+        mock_dicom.ImageOrientationPatient = [1.0, 0.0, 0.0, 0.0, 1.0, 0.0]
+        mock_dicom.ImagePositionPatient = [-200.0, 200.0, -50.0]
+        mock_dicom.pixel_array = np.ones((4, 3), dtype=np.int16)
+        mock_dicom.RescaleSlope = 2.0
+        mock_dicom.RescaleIntercept = -1024.0
+        mocker.patch(PATCH_DCMREAD, return_value=mock_dicom)
+
+        volume = load_volume(gen_path())
+
+        assert volume is not None
+        assert volume.shape == (4, 3, 2)
+        np.testing.assert_array_equal(volume, np.full((4, 3, 2), -1022.0))
+
+    # volume is flipped on width and depth and C-contiguous
+    def test_volume_is_flipped_and_contiguous(self, mocker):
+        def make_slice(z):
+            d_slice = mock.Mock()
+            d_slice.SOPClassUID = CT_IMAGE
+            d_slice.SliceThickness = 2.0
+            d_slice.ImageOrientationPatient = [1.0, 0.0, 0.0, 0.0, 1.0, 0.0]
+            d_slice.ImagePositionPatient = [0.0, 0.0, float(z)]
+            d_slice.pixel_array = np.arange(6, dtype=np.int16).reshape(2, 3) + 10 * z
+            d_slice.RescaleSlope = 1.0
+            d_slice.RescaleIntercept = 0.0
+            return d_slice
+
+        slices = {f"file{z}.dcm": make_slice(z) for z in range(3)}
+        mocker.patch(PATCH_LIST_FILES, return_value=list(slices))
+        mocker.patch(PATCH_DCMREAD, side_effect=lambda fname, **_: slices[fname])
+
+        volume = load_volume(gen_path())
+
+        stacked = np.stack([slices[f"file{z}.dcm"].pixel_array for z in range(3)], -1)
+        assert volume is not None
+        assert volume.flags.c_contiguous
+        np.testing.assert_array_equal(volume, stacked[:, ::-1, ::-1])
+
+    # pixel data is deferred until each slice is copied into the volume
+    def test_defers_reading_pixel_data(self, mocker):
+        mocker.patch(PATCH_LIST_FILES, return_value=["file1.dcm", "file2.dcm"])
+        mock_dcmread = mocker.patch(PATCH_DCMREAD, return_value=MOCK_DICOM)
+
+        load_volume(gen_path())
+
+        assert mock_dcmread.call_count == 2
+        assert all(
+            call.kwargs.get("defer_size") is not None
+            for call in mock_dcmread.call_args_list
+        )
+
     # directory contains no DICOM files
     def test_no_dicom_files_in_directory(self, mocker):
         # Mock the list_files function to return an empty list
@@ -82,6 +161,68 @@ class TestLoadVolume:
         result = load_volume(gen_path())
         assert result is None
 
+    # files added to the directory between loads are picked up
+    def test_relists_directory_on_each_load(self, mocker):
+        dicom_path = gen_path()
+        mocker.patch(
+            PATCH_LIST_FILES, side_effect=[["file1.dcm"], ["file1.dcm", "file2.dcm"]]
+        )
+        mocker.patch(PATCH_DCMREAD, return_value=MOCK_DICOM)
+
+        assert load_volume(dicom_path).shape[-1] == 1
+        assert load_volume(dicom_path).shape[-1] == 2
+
+
+class Test_SortBySliceOrder:
+    # slices are ordered by their position along the slice normal
+    def test_sorts_slices_along_normal(self):
+        slices = []
+        for z in [10.0, -5.0, 2.5]:
+            d_slice = mock.Mock()
+            d_slice.ImageOrientationPatient = [1.0, 0.0, 0.0, 0.0, 1.0, 0.0]
+            d_slice.ImagePositionPatient = [-200.0, 200.0, z]
+            slices.append(d_slice)
+
+        result = _sort_by_slice_order(iter(slices))
+
+        assert [d.ImagePositionPatient[2] for d in result] == [-5.0, 2.5, 10.0]
+
+    # no slices returns an empty list
+    def test_empty_slices(self):
+        assert _sort_by_slice_order([]) == []
+
+
+class Test_GetUniformSpacing:
+    @staticmethod
+    def _slice(pixel_spacing, slice_thickness):
+        return mock.Mock(PixelSpacing=pixel_spacing, SliceThickness=slice_thickness)
+
+    # Returns the shared (row, column, slice) spacing as floats
+    def test_uniform_spacing(self):
+        slices = [self._slice(["0.5", "0.5"], "2.0") for _ in range(3)]
+
+        assert _get_uniform_spacing(slices) == (0.5, 0.5, 2.0)
+
+    # Any slice differing on any axis makes the spacing non-uniform
+    def test_non_uniform_spacing(self):
+        slices = [self._slice([0.5, 0.5], 2.0), self._slice([0.5, 0.6], 2.0)]
+
+        assert _get_uniform_spacing(slices) is None
+
+    # No slices means there is no spacing
+    def test_no_slices(self):
+        assert _get_uniform_spacing([]) is None
+
+
+class Test_ParseDicomDate:
+    # Parses the DICOM DA format YYYYMMDD
+    def test_parses_dicom_date(self):
+        assert _parse_dicom_date("20171208") == date(2017, 12, 8)
+
+    # Parses the legacy YYYY.MM.DD format
+    def test_parses_legacy_dicom_date(self):
+        assert _parse_dicom_date("2017.12.08") == date(2017, 12, 8)
+
 
 class Test_LoadRtStruct:
     # Successfully loads RTStructBuilder from a valid DICOM RT struct file
@@ -107,6 +248,21 @@ class Test_LoadRtStruct:
             dicom_series_path=dicom_path, rt_struct_path="file.dcm"
         )
 
+    # Only SOPClassUID is read when looking for RT struct files
+    def test_reads_only_sop_class_uid(self, mocker):
+        dicom_path = gen_path()
+        mocker.patch(PATCH_RT_CREATE_FROM)
+        mocker.patch(PATCH_LIST_FILES, return_value=["file.dcm"])
+        mock_dcmread = mocker.patch(PATCH_DCMREAD, return_value=pydicom.Dataset())
+
+        assert list(_load_rt_structs(dicom_path)) == []
+        mock_dcmread.assert_called_once_with(
+            "file.dcm",
+            force=True,
+            stop_before_pixels=True,
+            specific_tags=["SOPClassUID"],
+        )
+
     # No RT struct file present in the directory
     def test_no_rt_struct_file_present(self, mocker):
         dicom_path = gen_path()
@@ -153,6 +309,8 @@ class TestLoadMask:
         assert "organ_2" in mask.keys()
         assert mask["organ_1"].shape == mock_mask1.shape
         assert mask["organ_2"].shape == mock_mask2.shape
+        assert mask["organ_1"].dtype == np.bool_
+        assert mask["organ_2"].dtype == np.bool_
 
     # Handle empty DICOM directory gracefully
     def test_load_mask_empty_directory(self, mocker):
@@ -217,13 +375,13 @@ class TestLoadPatientScan:
 
         mocker.patch(PATCH_DCMREAD, return_value=MOCK_DICOM)
 
-        # Mocking the load_volume function to return a numpy array
+        # Mocking the volume loading to return a numpy array
         mocker.patch(
-            PATCH_LOAD_VOLUME,
+            PATCH_LOAD_VOLUME_FROM_SLICES,
             return_value=np.moveaxis(np.array([[[1, 2], [3, 4]]]), 0, -1),
         )
 
-        # Mocking the load_mask function to return a list of Mask objects
+        # Mocking the _load_mask function to return a list of Mask objects
         mock_mask = {"a": np.ndarray((30, 30))}
         mocker.patch(PATCH_LOAD_MASK, return_value=mock_mask)
 
@@ -236,6 +394,53 @@ class TestLoadPatientScan:
         assert result["volume"].shape == (2, 2, 1)
         assert result["masks"] == mock_mask
 
+    # each DICOM file is read once for both the metadata and the volume
+    def test_reads_each_dicom_file_once(self, mocker):
+        mocker.patch(PATCH_LIST_FILES, return_value=["file1.dcm", "file2.dcm"])
+        mock_dcmread = mocker.patch(PATCH_DCMREAD, return_value=MOCK_DICOM)
+        mocker.patch(PATCH_LOAD_MASK, return_value={"a": np.zeros((2, 2, 2))})
+
+        result = load_patient_scan(gen_path())
+
+        assert result is not None
+        assert result["volume"].shape == (512, 412, 2)
+        assert mock_dcmread.call_count == 2
+
+    # patient directory is only listed once for the header and volume passes
+    def test_lists_patient_directory_once(self, mocker):
+        mock_list_files = mocker.patch(
+            PATCH_LIST_FILES, return_value=["file1.dcm", "file2.dcm"]
+        )
+        mocker.patch(PATCH_DCMREAD, return_value=MOCK_DICOM)
+        mocker.patch(PATCH_LOAD_MASK, return_value={"a": np.zeros((2, 2, 2))})
+
+        result = load_patient_scan(gen_path())
+
+        assert result is not None
+        mock_list_files.assert_called_once()
+
+    # the RT struct lookup reuses the listing from the slice pass
+    def test_passes_listing_to_rt_struct_lookup(self, mocker):
+        dicom_path = gen_path()
+        mock_list_files = mocker.patch(
+            PATCH_LIST_FILES, return_value=["file1.dcm", "file2.dcm"]
+        )
+        mocker.patch(PATCH_DCMREAD, return_value=MOCK_DICOM)
+        mock_rt_struct = mocker.Mock()
+        mock_rt_struct.get_roi_names.return_value = ["organ"]
+        mock_rt_struct.get_roi_mask_by_name.return_value = np.ones((2, 2, 2))
+        mock_load_rt_structs = mocker.patch(
+            PATCH_LOAD_RT_STRUCTS, return_value=[mock_rt_struct]
+        )
+
+        result = load_patient_scan(dicom_path)
+
+        assert result is not None
+        mock_list_files.assert_called_once()
+        mock_load_rt_structs.assert_called_once_with(
+            dicom_path, ("file1.dcm", "file2.dcm")
+        )
+
     def test_loads_patient_scan_no_masks(self, mocker):
         # Mocking the list_files function to return a list of DICOM file paths
         mocker.patch(
@@ -245,13 +450,13 @@ class TestLoadPatientScan:
 
         mocker.patch(PATCH_DCMREAD, return_value=MOCK_DICOM)
 
-        # Mocking the load_volume function to return a numpy array
+        # Mocking the volume loading to return a numpy array
         mocker.patch(
-            PATCH_LOAD_VOLUME,
+            PATCH_LOAD_VOLUME_FROM_SLICES,
             return_value=np.moveaxis(np.array([[[1, 2], [3, 4]]]), 0, -1),
         )
 
-        # Mocking the load_mask function to return a list of Mask objects
+        # Mocking the _load_mask function to return a list of Mask objects
         mock_mask = {}
         mocker.patch(PATCH_LOAD_MASK, return_value=mock_mask)
 
@@ -267,13 +472,13 @@ class TestLoadPatientScan:
         # Mocking the dicom.dcmread function to raise an exception when called with an empty list
         mocker.patch(PATCH_DCMREAD, side_effect=IndexError("list index out of range"))
 
-        # Mocking the load_volume function to return an empty numpy array
+        # Mocking the volume loading to return an empty numpy array
         mocker.patch(
-            PATCH_LOAD_VOLUME,
+            PATCH_LOAD_VOLUME_FROM_SLICES,
             return_value=np.array([]),
         )
 
-        # Mocking the load_mask function to return None
+        # Mocking the _load_mask function to return None
         mocker.patch(PATCH_LOAD_MASK, return_value=None)
 
         assert load_patient_scan(gen_path()) is None
@@ -288,9 +493,9 @@ class TestLoadPatientScan:
 
         mocker.patch(PATCH_DCMREAD, return_value=MOCK_DICOM)
 
-        # Mocking the load_volume function to return a numpy array
+        # Mocking the volume loading to return a numpy array
         mocker.patch(
-            PATCH_LOAD_VOLUME,
+            PATCH_LOAD_VOLUME_FROM_SLICES,
             return_value=np.moveaxis(np.array([[[1, 2], [3, 4]]]), 0, -1),
         )
 
@@ -304,8 +509,8 @@ class TestLoadPatientScan:
 class TestLoadPatientScans:
     # Successfully loads multiple PatientScan objects from a directory with valid DICOM files
     def test_loads_multiple_patient_scans_successfully(self, mocker):
-        # Mock the os.listdir to return a list of directories
-        mocker.patch(PATCH_LISTDIR, return_value=["patient1", "patient2"])
+        # Mock generate_subdirs to return a list of directories
+        mocker.patch(PATCH_GENERATE_SUBDIRS, return_value=["patient1", "patient2"])
         # Mocking the list_files function to return a list of DICOM file paths
         mocker.patch(
             PATCH_LIST_FILES,
@@ -315,9 +520,9 @@ class TestLoadPatientScans:
         mocker.patch(PATCH_DCMREAD, return_value=MOCK_DICOM)
 
         mock_volume = np.random.randint(0, 2, (512, 512, 4))
-        # Mocking the load_volume function to return a numpy array
+        # Mocking the volume loading to return a numpy array
         mocker.patch(
-            PATCH_LOAD_VOLUME,
+            PATCH_LOAD_VOLUME_FROM_SLICES,
             return_value=mock_volume,
         )
 
@@ -325,7 +530,7 @@ class TestLoadPatientScans:
             "organ_1": np.random.randint(0, 2, (512, 512, 4)),
             "organ_2": np.random.randint(0, 2, (512, 512, 4)),
         }
-        # Mocking the load_mask function to return None since no RT struct data is found
+        # Mocking the _load_mask function to return None since no RT struct data is found
         mocker.patch(PATCH_LOAD_MASK, return_value=mock_mask)
 
         # Call the function under test
@@ -344,8 +549,8 @@ class TestLoadPatientScans:
 
     # Handles an empty directory gracefully
     def test_handles_empty_directory_gracefully(self, mocker):
-        # Mock the os.listdir to return an empty list
-        mocker.patch(PATCH_LISTDIR, return_value=[])
+        # Mock generate_subdirs to return an empty list
+        mocker.patch(PATCH_GENERATE_SUBDIRS, return_value=[])
 
         # Call the function under test
         result = list(load_all_patient_scans(gen_path()))
@@ -353,12 +558,46 @@ class TestLoadPatientScans:
         # Assertions
         assert result == []
 
+    # Process workers load patients, even after a thread pmap ran in this process
+    def test_loads_patients_in_parallel_after_thread_pmap(self, tmp_path):
+        rng = np.random.default_rng(0)
+        for patient in ["patient1", "patient2", "patient3"]:
+            (tmp_path / patient).mkdir()
+            for z in range(3):
+                pixels = rng.integers(0, 2000, (4, 5))
+                write_ct_slice(tmp_path / patient / f"{z}.dcm", z, pixels)
+        # Leaves a thread pool cached in this process for the workers to inherit
+        assert list(pmap(lambda x: x + 1, range(4), executor="thread")) == [1, 2, 3, 4]
+
+        result = list(load_all_volumes(tmp_path, n_workers=2))
+
+        expected = list(load_all_volumes(tmp_path))
+        assert len(result) == 3
+        for volume, expected_volume in zip(result, expected):
+            np.testing.assert_array_equal(volume, expected_volume)
+
+    # Only n_workers patients are loaded before the first result is consumed
+    def test_loads_n_workers_patients_at_a_time(self, tmp_path, mocker):
+        patients = [f"patient{i}" for i in range(6)]
+        mocker.patch(PATCH_GENERATE_SUBDIRS, return_value=iter(patients))
+
+        # Workers are separate processes, record each load as a file
+        def load(patient):
+            (tmp_path / patient).touch()
+            return patient
+
+        result = _load_each_patient(load, gen_path(), n_workers=2)
+
+        assert next(result) == "patient0"
+        assert {path.name for path in tmp_path.iterdir()} <= {"patient0", "patient1"}
+        assert list(result) == patients[1:]
+
 
 class TestLoadAllMasks:
     # Successfully loads masks from a directory containing valid DICOM files
     def test_loads_masks_from_valid_dicom_directory(self, mocker):
         dicom_collection_path = gen_path()
-        mocker.patch(PATCH_LISTDIR, return_value=["patient_1", "patient_2"])
+        mocker.patch(PATCH_GENERATE_SUBDIRS, return_value=["patient_1", "patient_2"])
         mock_rt_struct = mocker.Mock()
         mock_rt_struct.get_roi_names.return_value = ["Organ 1", "Organ 2"]
         mock_mask = np.random.randint(0, 2, (512, 512, 4))
@@ -389,7 +628,7 @@ class TestLoadAllMasks:
     # Directory contains no DICOM files
     def test_no_dicom_files_in_directory(self, mocker):
         dicom_collection_path = gen_path()
-        mocker.patch(PATCH_LISTDIR, return_value=[])
+        mocker.patch(PATCH_GENERATE_SUBDIRS, return_value=[])
 
         result = list(load_all_masks(dicom_collection_path))
 
@@ -405,7 +644,7 @@ class TestLoadRoiNames:
         rt_struct.get_roi_names.return_value = ["ROI1", "ROI2", "ROI3"]
 
         mocker.patch(PATCH_LOAD_RT_STRUCTS, return_value=[rt_struct])
-        mocker.patch(PATCH_GENERATE_FULL_PATHS, return_value=lambda _: [tmp_path])
+        mocker.patch(PATCH_GENERATE_SUBDIRS, return_value=[tmp_path])
 
         # Call function
         result = next(load_roi_names(str(tmp_path)))
@@ -433,8 +672,8 @@ class TestLoadRoiNames:
             side_effect=[[rt_struct], [rt_struct2], [rt_struct3]],
         )
         mocker.patch(
-            PATCH_GENERATE_FULL_PATHS,
-            return_value=lambda _: [tmp_path, tmp_path, tmp_path],
+            PATCH_GENERATE_SUBDIRS,
+            return_value=[tmp_path, tmp_path, tmp_path],
         )
 
         # Call function
@@ -443,6 +682,23 @@ class TestLoadRoiNames:
         # Verify results
         assert result == expected
 
+    # only the first RT struct in each folder is parsed
+    def test_parses_first_rt_struct_only(self, mocker):
+        dicom_path = gen_path()
+        mock_dicom_file = pydicom.Dataset()
+        mock_dicom_file.SOPClassUID = RT_STRUCTURE_SET
+        rt_struct = mocker.Mock()
+        rt_struct.get_roi_names.return_value = ["ROI1"]
+        mock_rt_struct_builder = mocker.patch(
+            PATCH_RT_CREATE_FROM, return_value=rt_struct
+        )
+        mocker.patch(PATCH_LIST_FILES, return_value=["rt1.dcm", "rt2.dcm"])
+        mocker.patch(PATCH_DCMREAD, return_value=mock_dicom_file)
+        mocker.patch(PATCH_GENERATE_SUBDIRS, return_value=[dicom_path])
+
+        assert list(load_roi_names(dicom_path)) == [["ROI1"]]
+        mock_rt_struct_builder.assert_called_once()
+
 
 class TestPurgeDicomDir:
 
@@ -474,6 +730,24 @@ class TestPurgeDicomDir:
         assert rt_file.exists()
         assert not other_file.exists()
 
+    # Removes DICOM files that have no SOPClassUID
+    def test_purge_removes_files_without_sop_class_uid(self, tmp_path):
+        ct_file = tmp_path / "ct.dcm"
+        no_uid_file = tmp_path / "no_uid.dcm"
+
+        ct_ds = pydicom.Dataset()
+        ct_ds.SOPClassUID = CT_IMAGE
+        ct_ds.save_as(ct_file, implicit_vr=True)
+
+        no_uid_ds = pydicom.Dataset()
+        no_uid_ds.PatientID = "12345"
+        no_uid_ds.save_as(no_uid_file, implicit_vr=True)
+
+        purge_dicom_dir(tmp_path, prog_bar=False)
+
+        assert ct_file.exists()
+        assert not no_uid_file.exists()
+
 
 class TestComputeDatasetStats:
 
@@ -519,3 +793,28 @@ class TestComputeDatasetStats:
         )
         assert stats["manufacturer"] == set(["GE", "Siemens"])
         assert stats["scanner"] == set(["Scanner1", "Scanner2", "Scanner3"])
+
+    # Accepts a lazy generator of scans, e.g. from load_all_patient_scans
+    def test_accepts_generator_of_scans(self):
+        scans = (
+            {
+                "volume": np.zeros(shape),
+                "dimension_original": shape,
+                "spacings": (1.0, 1.0, 2.0),
+                "manufacturer": manufacturer,
+                "scanner": "Scanner1",
+            }
+            for shape, manufacturer in [((2, 4, 6), "GE"), ((4, 6, 8), "Siemens")]
+        )
+
+        stats = compute_dataset_stats(scans)  # type: ignore
+
+        assert np.allclose(stats["dimension_actual"], [3, 5, 7])  # type: ignore
+        assert np.allclose(stats["spacings"], [1.0, 1.0, 2.0])  # type: ignore
+        assert stats["manufacturer"] == {"GE", "Siemens"}
+        assert stats["scanner"] == {"Scanner1"}
+
+    # Raises on an empty dataset instead of returning NaN means
+    def test_empty_dataset_raises(self):
+        with pytest.raises(ValueError):
+            compute_dataset_stats([])
@@ -1,12 +1,8 @@
-import os
-import sys
-
 import numpy as np
+import pytest
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-sys.path.append(os.path.realpath(f"{dir_path}/../../../turtwig"))
-
-from turtwig.data import bounding_box_3d, make_isotropic, map_interval
+from turtwig.data import (bounding_box_3d, crop_to_bbox_3d, make_isotropic,
+                          map_interval, z_score_scale)
 
 
 class TestMapInterval:
@@ -80,6 +76,81 @@ class TestMapInterval:
         result = map_interval(array, from_range, to_range)
         np.testing.assert_array_almost_equal(result, expected)
 
+    # returns float64 array for integer input and reversed target range
+    def test_maps_integer_array_to_reversed_range_as_float64(self):
+        array = np.array([0, 5, 10], dtype=np.int16)
+        expected = np.array([1.0, 0.5, 0.0])
+
+        result = map_interval(array, (0, 10), (1, 0))
+        np.testing.assert_array_almost_equal(result, expected)
+        assert result.dtype == np.float64
+
+    # zero-width from_range can't be scaled
+    def test_zero_width_from_range_raises(self):
+        with pytest.raises(ValueError):
+            map_interval(np.array([1, 2, 3]), (5, 5), (0, 1))
+
+    # result can be returned as float32
+    def test_maps_to_float32(self):
+        array = np.array([0, 5, 10], dtype=np.int16)
+
+        result = map_interval(array, (0, 10), (0, 1), dtype=np.float32)
+
+        assert result.dtype == np.float32
+        np.testing.assert_array_almost_equal(result, np.array([0.0, 0.5, 1.0]))
+
+
+class TestZScoreScale:
+    # matches (x - mean) / std for float and integer volumes
+    def test_matches_two_pass_formula(self):
+        rng = np.random.default_rng(0)
+        for array in [
+            rng.normal(-500, 400, (8, 9, 10)),
+            rng.integers(-1024, 3000, (8, 9, 10)).astype(np.int16),
+        ]:
+            expected = (array - array.mean()) / array.std()
+
+            result = z_score_scale(array)
+
+            assert result.dtype == np.float64
+            np.testing.assert_allclose(result, expected, rtol=1e-10, atol=1e-12)
+
+    # normalised array has mean 0 and standard deviation 1
+    def test_zero_mean_unit_std(self):
+        result = z_score_scale(np.array([1, 2, 3, 4, 5]))
+
+        np.testing.assert_almost_equal(result.mean(), 0.0)
+        np.testing.assert_almost_equal(result.std(), 1.0)
+
+    # a large mean with a small spread keeps its precision
+    def test_large_mean_small_spread(self):
+        array = np.random.default_rng(0).normal(1e5, 0.01, (8, 9, 10))
+
+        result = z_score_scale(array)
+
+        np.testing.assert_allclose(result.std(), 1.0, rtol=1e-9)
+        np.testing.assert_allclose(
+            result, (array - array.mean()) / array.std(), rtol=1e-6, atol=1e-6
+        )
+
+    # a constant array has zero spread and no finite z-scores, as before
+    def test_constant_array_gives_nan(self):
+        with np.errstate(invalid="ignore"):
+            result = z_score_scale(np.full(10, 1e6))
+
+        assert np.isnan(result).all()
+
+    # result can be returned as float32, statistics stay float64 accurate
+    def test_float32_output(self):
+        array = np.random.default_rng(0).normal(-500, 400, (8, 9, 10))
+
+        result = z_score_scale(array, dtype=np.float32)
+
+        assert result.dtype == np.float32
+        np.testing.assert_allclose(
+            result, (array - array.mean()) / array.std(), rtol=1e-5, atol=1e-5
+        )
+
 
 class TestMakeIsotropic:
     # Interpolates a 2D array with given spacings to an isotropic grid with 1 unit spacing
@@ -134,6 +205,65 @@ class TestMakeIsotropic:
 
         assert result.dtype == array.dtype
 
+    # Points within half a voxel past the edge keep the edge value, points beyond are 0
+    def test_interpolates_3d_array_edges(self):
+        array = np.array([0.0, 1.0, 2.0]).reshape(1, 1, 3)
+
+        result = make_isotropic(array, [1, 1, 2.5])
+
+        np.testing.assert_array_almost_equal(
+            result, np.array([0.0, 0.4, 0.8, 1.2, 1.6, 2.0, 2.0, 0.0]).reshape(1, 1, 8)
+        )
+
+    # Integer masks match sitk.Resample with linear interpolation exactly
+    def test_linear_integer_mask_matches_sitk(self):
+        import SimpleITK as sitk
+
+        rng = np.random.default_rng(0)
+        mask = rng.integers(0, 2, (5, 6, 7)).astype(np.uint8)
+        spacings = [1.5, 2.0, 2.5]
+        new_size = [int(round(n * s)) for n, s in zip(mask.shape, spacings)]
+
+        image = sitk.GetImageFromArray(mask.astype(np.float32).T)
+        image.SetSpacing(spacings)
+        expected = sitk.Resample(
+            image,
+            new_size,
+            sitk.Transform(),
+            sitk.sitkLinear,
+            image.GetOrigin(),
+            (1, 1, 1),
+            image.GetDirection(),
+            0,
+            image.GetPixelID(),
+        )
+
+        result = make_isotropic(mask, spacings, method="linear")
+
+        np.testing.assert_array_equal(
+            result, sitk.GetArrayFromImage(expected).T.astype(np.uint8)
+        )
+
+    # Sample points on a zero voxel are exactly 0, where sitk leaves ~4e-16 (row 5)
+    def test_linear_is_exactly_zero_outside_support(self):
+        array = np.zeros((5, 1), dtype=np.float32)
+        array[3, 0] = 1.0
+
+        result = make_isotropic(array, [2.5, 1], method="linear")
+
+        np.testing.assert_array_almost_equal(
+            result[:, 0], [0, 0, 0, 0, 0, 0, 0.4, 0.8, 0.8, 0.4, 0, 0]
+        )
+        assert np.flatnonzero(result[:, 0]).tolist() == [6, 7, 8, 9]
+
+    # SimpleITK methods keep the (H, W, D) axis order of the input
+    def test_sitk_method_keeps_axis_order(self):
+        array = np.ones((4, 5, 6))
+
+        result = make_isotropic(array, [1, 2, 3], method="b_spline")
+
+        assert result.shape == (4, 10, 18)
+
 
 class TestBoundingBox3d:
 
@@ -158,7 +288,7 @@ class TestBoundingBox3d:
         def generate_binary_3d_oval_with_bbox(
             volume_shape=(100, 100, 100), center=(50, 50, 50), radii=(30, 20, 10)
         ):
-            z, y, x = np.indices(volume_shape)
+            z, y, x = np.ogrid[: volume_shape[0], : volume_shape[1], : volume_shape[2]]
             # Normalized distances for the ellipsoid
             normalized_distances = (
                 ((x - center[0]) / radii[0]) ** 2
@@ -196,3 +326,47 @@ class TestBoundingBox3d:
         assert cmax == cmax_
         assert zmin == zmin_
         assert zmax == zmax_
+
+    # Arrays with no foreground have no bounding box
+    def test_empty_array_raises(self):
+        with pytest.raises(ValueError):
+            bounding_box_3d(np.zeros((4, 4, 4)))
+
+    # Foreground touching the array edges gives the edge indices
+    def test_foreground_on_edges(self):
+        img = np.zeros((5, 6, 7), dtype=bool)
+        img[0, 5, 3] = img[4, 0, 6] = True
+
+        assert bounding_box_3d(img) == (0, 4, 0, 5, 3, 6)
+
+
+class TestCropToBbox3d:
+    # Crops a binary array to its bounding box, including the last foreground index
+    def test_crops_binary_array(self):
+        img = np.zeros((10, 10, 10))
+        img[2:5, 3:7, 4:8] = 1
+
+        result = crop_to_bbox_3d(img)
+
+        assert result.shape == (3, 4, 4)
+        assert result.all()
+
+    # Thresholds the array before computing the bounding box
+    def test_crops_with_threshold(self):
+        img = np.full((6, 6, 6), 0.2)
+        img[1:3, 2:5, 0:6] = 0.9
+
+        result = crop_to_bbox_3d(img, thresh=0.5)
+
+        np.testing.assert_array_equal(result, np.full((2, 3, 6), 0.9))
+
+    # Thresholding across several slabs gives the same crop as a single pass
+    def test_threshold_across_slabs(self, monkeypatch):
+        img = np.random.default_rng(0).normal(size=(9, 7, 5))
+        rmin, rmax, cmin, cmax, zmin, zmax = bounding_box_3d(img > 1.5)
+        expected = img[rmin : rmax + 1, cmin : cmax + 1, zmin : zmax + 1]
+        monkeypatch.setattr("turtwig.data.numpy.THRESH_SLAB_BYTES", 2 * 7 * 5)
+
+        result = crop_to_bbox_3d(img, thresh=1.5)
+
+        np.testing.assert_array_equal(result, expected)
@@ -1,46 +1,52 @@
 import os
-import sys
 import tempfile
+import zlib
 from datetime import date
 
 import h5py
 import numpy as np
+import pytest
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-sys.path.append(os.path.realpath(f"{dir_path}/../../../turtwig"))
-
-from turtwig.data import dict_from_h5, dict_to_h5
-
-dataset = {
-    "0": {
-        "patient_id": 5,
-        "volume": np.zeros((10, 10, 10)),
-        "dimension_original": (10, 10, 10),
-        "spacings": (1.0, 1.0, 1.0),
-        "modality": "CT",
-        "manufacturer": "GE",
-        "scanner": "Optima",
-        "study_date": date(2021, 1, 1),
-        "masks": {
-            "organ1": np.ones((10, 10, 10)),
-            "organ2": np.zeros((10, 10, 10)),
-        },
-    },
-    "1": {
-        "patient_id": 6,
-        "volume": np.ones((10, 10, 10)),
-        "dimension_original": (10, 10, 10),
-        "spacings": (1.0, 1.0, 1.0),
-        "modality": "CT",
-        "manufacturer": "GE",
-        "scanner": "Optima",
-        "study_date": date(2021, 1, 1),
-        "masks": {
-            "organ1": np.zeros((10, 10, 10)),
-            "organ2": np.ones((10, 10, 10)),
-        },
-    },
-}
+from turtwig.data import (CompressedPayload, LazyDataset, dict_from_h5,
+                          dict_to_h5)
+from turtwig.data.h5 import CHUNK_BYTES, SMALL_DATASET_BYTES, _pick_chunks
+
+
+def _filled(value: float) -> np.ndarray:
+    """
+    Read-only (10, 10, 10) view of ``value``, without allocating the volume
+    """
+    return np.broadcast_to(np.float64(value), (10, 10, 10))
+
+
+@pytest.fixture(scope="module")
+def dataset():
+    return {
+        str(i): {
+            "patient_id": 5 + i,
+            "volume": _filled(i),
+            "dimension_original": (10, 10, 10),
+            "spacings": (1.0, 1.0, 1.0),
+            "modality": "CT",
+            "manufacturer": "GE",
+            "scanner": "Optima",
+            "study_date": date(2021, 1, 1),
+            "masks": {
+                "organ1": _filled(1 - i),
+                "organ2": _filled(i),
+            },
+        }
+        for i in range(2)
+    }
+
+
+def _assert_filled(arr: np.ndarray, value: float, shape: tuple[int, ...]) -> None:
+    """
+    Assert ``arr`` has ``shape`` and every element equals ``value``, in one pass
+    """
+    assert arr.shape == shape
+    assert arr.dtype == np.float64
+    assert np.ptp(arr) == 0 and arr.flat[0] == value
 
 
 class TestDictToH5:
@@ -84,7 +90,7 @@ class TestDictToH5:
             assert np.array_equal(f["test_group"]["list2"][()], np.array([[1.0, 2.0, 3.0] for _ in range(2)]))  # type: ignore
 
     # Successfully saves single dictionary with all fields to H5 file
-    def test_save_dict(self):
+    def test_save_dict(self, dataset):
         with tempfile.NamedTemporaryFile() as tmp:
             test_path = tmp.name
 
@@ -97,11 +103,11 @@ class TestDictToH5:
                 for i in range(2):
                     patient = f[str(i)]
                     assert patient["patient_id"][()] == dataset[str(i)]["patient_id"]  # type: ignore
-                    assert np.array_equal(patient["volume"][()], dataset[str(i)]["volume"])  # type: ignore
+                    _assert_filled(patient["volume"][()], i, (10, 10, 10))  # type: ignore
                     assert patient["modality"][()].decode() == "CT"  # type: ignore
-                    assert np.array_equal(patient["masks/organ1"][()], dataset[str(i)]["masks"]["organ1"])  # type: ignore
+                    _assert_filled(patient["masks/organ1"][()], 1 - i, (10, 10, 10))  # type: ignore
 
-    def test_save_dict_iterator(self):
+    def test_save_dict_iterator(self, dataset):
         def iter_dataset():
             for i in range(2):
                 yield dataset[str(i)]
@@ -120,11 +126,74 @@ class TestDictToH5:
                     patient = f[str(i)]
                     assert patient["patient_id"][()] == dataset[str(i)]["patient_id"]  # type: ignore
 
+    # Array datasets are chunked to at most CHUNK_BYTES and byte-shuffled
+    def test_arrays_are_chunked_and_shuffled(self, tmp_path):
+        test_path = tmp_path / "test.h5"
+        volume = np.arange(256 * 256 * 16, dtype=np.int16).reshape(256, 256, 16)
+
+        dict_to_h5({"volume": volume, "empty": []}, test_path)
+
+        with h5py.File(test_path, "r") as f:
+            chunks = f["volume"].chunks  # type: ignore
+            assert chunks is not None
+            assert np.prod(chunks) * volume.itemsize <= CHUNK_BYTES
+            assert f["volume"].shuffle  # type: ignore
+            assert np.array_equal(f["volume"][()], volume)  # type: ignore
+            assert f["empty"].shape == (0,)  # type: ignore
+
+    # Small arrays are stored contiguous without compression
+    def test_small_arrays_are_not_compressed(self, tmp_path):
+        test_path = tmp_path / "test.h5"
+        small = np.arange(10, dtype=np.float64)
+        assert small.nbytes < SMALL_DATASET_BYTES
+
+        dict_to_h5({"small": small}, test_path)
+
+        with h5py.File(test_path, "r") as f:
+            assert f["small"].chunks is None  # type: ignore
+            assert f["small"].compression is None  # type: ignore
+            assert np.array_equal(f["small"][()], small)  # type: ignore
+
+    # Sequences of same-shape arrays are stacked along a new first axis
+    def test_stacks_tuple_of_arrays(self, tmp_path):
+        test_path = tmp_path / "test.h5"
+        arrays = (np.zeros((2, 3)), np.ones((2, 3), dtype=np.int32))
+
+        dict_to_h5({"stacked": arrays}, test_path)
+
+        with h5py.File(test_path, "r") as f:
+            assert np.array_equal(f["stacked"][()], np.stack(arrays))  # type: ignore
+
+    # Pre-compressed payloads are written as a single chunk and read back decompressed
+    def test_writes_compressed_payload_directly(self, tmp_path):
+        test_path = tmp_path / "test.h5"
+        volume = np.arange(60, dtype=np.int16).reshape(3, 4, 5)
+        payload = CompressedPayload(
+            zlib.compress(volume.tobytes()), volume.shape, volume.dtype
+        )
+
+        dict_to_h5({"volume": payload}, test_path)
+
+        with h5py.File(test_path, "r") as f:
+            assert f["volume"].chunks == volume.shape  # type: ignore
+            assert f["volume"].compression == "gzip"  # type: ignore
+            assert np.array_equal(f["volume"][()], volume)  # type: ignore
+
+
+class TestPickChunks:
+    # Array smaller than the target is stored as a single chunk
+    def test_small_array_is_one_chunk(self):
+        assert _pick_chunks((10, 10, 10), 8) == (10, 10, 10)
+
+    # Largest axis is halved until the chunk fits
+    def test_halves_largest_axis(self):
+        assert _pick_chunks((512, 512, 100), 2) == (64, 64, 100)
+
 
 class TestDictFromH5:
 
     # Successfully loads dict with all fields from H5 file
-    def test_load_dataset(self):
+    def test_load_dataset(self, dataset):
         with tempfile.NamedTemporaryFile() as tmp:
             test_path = tmp.name
 
@@ -135,17 +204,56 @@ class TestDictFromH5:
 
             for i, data in loaded.items():
                 assert data["patient_id"] == dataset[i]["patient_id"]
-                assert np.array_equal(data["volume"], dataset[i]["volume"])
+                _assert_filled(data["volume"], int(i), (10, 10, 10))
                 assert data["modality"] == "CT"
-                assert data["masks"]["organ1"].shape == (10, 10, 10)
-                assert np.array_equal(
-                    data["masks"]["organ1"], dataset[i]["masks"]["organ1"]
-                )
-                assert np.array_equal(
-                    data["masks"]["organ2"], dataset[i]["masks"]["organ2"]
-                )
+                _assert_filled(data["masks"]["organ1"], 1 - int(i), (10, 10, 10))
+                _assert_filled(data["masks"]["organ2"], int(i), (10, 10, 10))
                 assert data["study_date"] == "2021-01-01"
                 assert data["dimension_original"].tolist() == [10, 10, 10]
                 assert data["spacings"].tolist() == [1.0, 1.0, 1.0]
                 assert data["manufacturer"] == "GE"
                 assert data["scanner"] == "Optima"
+
+    # Large datasets are returned as LazyDataset, readable after the file is closed
+    def test_lazy_load_large_datasets(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("turtwig.data.h5.LAZY_MIN_BYTES", 1000)
+        test_path = tmp_path / "test.h5"
+        volume = np.arange(1000, dtype=np.float64).reshape(10, 10, 10)
+        dict_to_h5(
+            {"volume": volume, "small": np.arange(3), "modality": "CT"}, test_path
+        )
+
+        loaded = dict_from_h5(test_path, lazy=True)
+
+        assert isinstance(loaded["volume"], LazyDataset)
+        assert loaded["volume"].shape == (10, 10, 10)
+        assert np.array_equal(loaded["volume"][..., 0], volume[..., 0])
+        assert np.array_equal(np.asarray(loaded["volume"]), volume)
+        assert isinstance(loaded["small"], np.ndarray)
+        assert loaded["modality"] == "CT"
+
+    # Reading from disk always copies, so copy=False can't be honoured
+    def test_lazy_dataset_rejects_copy_false(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("turtwig.data.h5.LAZY_MIN_BYTES", 1000)
+        test_path = tmp_path / "test.h5"
+        dict_to_h5({"volume": np.zeros((10, 10, 10))}, test_path)
+
+        loaded = dict_from_h5(test_path, lazy=True)
+
+        with pytest.raises(ValueError):
+            np.array(loaded["volume"], copy=False)
+
+    # Lazily loaded datasets can be written back, to another file or the same one
+    def test_lazy_dataset_round_trip(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("turtwig.data.h5.LAZY_MIN_BYTES", 1000)
+        src_path = tmp_path / "src.h5"
+        dst_path = tmp_path / "dst.h5"
+        volume = np.arange(1000, dtype=np.float64).reshape(10, 10, 10)
+        dict_to_h5({"volume": volume}, src_path)
+
+        loaded = dict_from_h5(src_path, lazy=True)
+        dict_to_h5({"copy": loaded}, dst_path)
+        dict_to_h5({"copy": loaded["volume"]}, src_path)
+
+        assert np.array_equal(dict_from_h5(dst_path)["copy"]["volume"], volume)
+        assert np.array_equal(dict_from_h5(src_path)["copy"], volume)
@@ -1,9 +1,5 @@
-import os
 import sys
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-sys.path.append(os.path.realpath(f"{dir_path}/../../../turtwig"))
-
 from turtwig.futils import iterate_while
 
 
@@ -21,20 +17,34 @@ class TestIterateWhile:
         result = iterate_while(func, pred, 0)
         assert result == 5
 
-    # Handles infinite loops gracefully if pred never returns False
+    # Keeps iterating past the recursion limit if pred never returns False
     def test_handles_infinite_loops_gracefully(self):
 
         import pytest
 
+        class Stop(Exception):
+            pass
+
+        limit = sys.getrecursionlimit() * 10
+
         def func(x):
+            if x >= limit:
+                raise Stop
             return x + 1
 
         def pred(x):
             return True
 
-        with pytest.raises(RecursionError):
+        with pytest.raises(Stop):
             iterate_while(func, pred, 0)
 
+    # Runs many more iterations than the recursion limit
+    def test_iterates_beyond_recursion_limit(self):
+        limit = sys.getrecursionlimit() * 10
+
+        result = iterate_while(lambda x: x + 1, lambda x: x < limit, 0)
+        assert result == limit
+
     # Returns initial value if pred returns False on the first call
     def test_returns_initial_value_if_pred_false_on_first_call(self):
 
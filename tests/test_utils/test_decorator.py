@@ -1,13 +1,8 @@
-import os
-import sys
+import inspect
 
 import pytest
 from pydantic import ValidationError, validate_call
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-sys.path.append(os.path.realpath(f"{dir_path}/../../../turtwig"))
-
-
 from turtwig.futils.decorator import curry
 
 
@@ -221,3 +216,23 @@ class TestCurry:
             test(1)("2", 3)
         with pytest.raises(ValidationError):
             test(1, c=2)("a")
+
+    # signature of the wrapped function is attached to the curried function
+    def test_exposes_signature(self):
+        def test(a, b, *, c=3):
+            return a, b, c
+
+        curried = curry(test)
+
+        assert curried.__signature__ == inspect.signature(test)
+        assert inspect.signature(validate_call(curried)) == inspect.signature(test)
+
+    # builtins without an inspectable signature are curried with toolz
+    def test_fallback_for_builtins(self):
+        with pytest.raises(ValueError):
+            curry(max)
+
+        curried_max = curry(max, fallback=True)
+
+        assert curried_max(1, 2) == 2
+        assert curried_max.__name__ == "max"
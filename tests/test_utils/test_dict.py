@@ -1,10 +1,7 @@
-import os
-import sys
+import pytest
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-sys.path.append(os.path.realpath(f"{dir_path}/../../../turtwig"))
-
-from turtwig.futils import merge_with_reduce
+from turtwig.futils import (merge_with_reduce, merge_with_reduce_unchecked,
+                            rename_key)
 
 
 class TestMergeWithReduce:
@@ -21,3 +18,43 @@ class TestMergeWithReduce:
         dicts = [{"b": 1, "c": 2}, {"b": 3, "c": 4}, {"b": 5, "c": 6}]
         result = merge_with_reduce(dicts, lambda x, y: x**y)
         assert result == {"b": 1, "c": 16777216}
+
+    # Reduces values in the order the dictionaries are given
+    def test_reduces_values_in_input_order(self):
+        dicts = [{"a": "x"}, {"a": "y"}, {"a": "z"}]
+        result = merge_with_reduce(dicts, lambda x, y: x + y)
+        assert result == {"a": "xyz"}
+
+    # Empty input passes validation and fails on the reduce, not on indexing
+    def test_empty_list_raises(self):
+        with pytest.raises(TypeError):
+            merge_with_reduce([], lambda x, y: x + y)
+
+
+class TestMergeWithReduceUnchecked:
+
+    # Gives the same result as the validated version
+    def test_matches_merge_with_reduce(self):
+        dicts = [{"b": 1, "c": 2}, {"b": 3, "c": 4}, {"b": 5, "c": 6}]
+        expected = merge_with_reduce(dicts, lambda x, y: x + y)
+        assert merge_with_reduce_unchecked(dicts, lambda x, y: x + y) == expected
+
+    # Empty input has nothing to reduce
+    def test_empty_list_raises(self):
+        with pytest.raises(TypeError, match="merge_with_reduce_unchecked"):
+            merge_with_reduce_unchecked([], lambda x, y: x + y)
+
+
+class TestRenameKey:
+
+    # Renamed key keeps its position in the dictionary
+    def test_keeps_key_order(self):
+        result = rename_key("a", "z", {"c": 0, "a": 1, "b": 2})
+        assert list(result.items()) == [("c", 0), ("z", 1), ("b", 2)]
+
+    # Missing key returns an equal copy, not the input dictionary
+    def test_missing_key_returns_copy(self):
+        dictionary = {"a": 1}
+        result = rename_key("x", "y", dictionary)
+        assert result == dictionary
+        assert result is not dictionary
@@ -0,0 +1,45 @@
+from copy import copy
+
+from turtwig.futils import call_method
+
+
+class Counter:
+    def __init__(self):
+        self.count = 0
+        self.log = []
+
+    def add(self, n, note=None):
+        self.count += n
+        self.log.append(note)
+
+
+class TestCallMethod:
+
+    # pure calls modify and return a copy, leaving the input untouched
+    def test_pure_copies_object(self):
+        counter = Counter()
+
+        result = call_method("add", 2, note="a")(counter)
+
+        assert result is not counter
+        assert (result.count, result.log) == (2, ["a"])
+        assert (counter.count, counter.log) == (0, [])
+
+    # impure calls modify and return the input object
+    def test_impure_modifies_object(self):
+        counter = Counter()
+
+        result = call_method("add", 2, pure=False)(counter)
+
+        assert result is counter
+        assert counter.count == 2
+
+    # copy_fn replaces the default deep copy
+    def test_custom_copy_fn(self):
+        counter = Counter()
+
+        result = call_method("add", 1, note="b", copy_fn=copy)(counter)
+
+        assert result is not counter
+        assert result.count == 1
+        assert counter.log == ["b"]  # shallow copy shares the list
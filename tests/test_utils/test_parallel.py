@@ -1,12 +1,9 @@
 import os
-import sys
-
-dir_path = os.path.dirname(os.path.realpath(__file__))
-sys.path.append(os.path.realpath(f"{dir_path}/../../../turtwig"))
-
-
 import time
 
+import numpy as np
+import pytest
+
 from turtwig.futils import pmap
 
 
@@ -30,6 +27,14 @@ class TestPmap:
         result = list(pmap(func, iterable1, iterable2, n_workers=3, executor="process"))
         assert result == [5, 7, 9]
 
+    # Test that elements are sent to workers in chunks, keeping input order
+    @pytest.mark.parametrize("chunksize", [None, 1, 7])
+    def test_chunksize_keeps_order(self, chunksize):
+        result = list(
+            pmap(lambda x: x * 2, range(100), n_workers=2, chunksize=chunksize)
+        )
+        assert result == [x * 2 for x in range(100)]
+
     # Test that pmap utilises parallelism to match the expected runtime
     def test_runtime_matches_parallel_execution(self):
         def func(x):
@@ -49,3 +54,23 @@ class TestPmap:
         # Ensure the total runtime matches the sleep time (~1 second)
         runtime = end_time - start_time
         assert runtime < 2.5, f"Runtime too long: {runtime} seconds"
+
+    # Test that large numpy arrays are passed correctly to process workers
+    def test_passes_large_arrays_to_process_workers(self):
+        arrays = [np.full((1 << 20) // 8, i, dtype=np.float64) for i in range(3)]
+
+        result = list(pmap(lambda a, k: a.sum() + k, arrays, [1, 2, 3], n_workers=2))
+
+        assert result == [a.sum() + k for a, k in zip(arrays, [1, 2, 3])]
+
+    # Test that repeated calls reuse the same worker processes
+    def test_reuses_process_pool_between_calls(self):
+        def worker_pid(_):
+            time.sleep(0.05)  # Keep each worker busy so both receive tasks
+            return os.getpid()
+
+        first = set(pmap(worker_pid, range(8), n_workers=2))
+        second = set(pmap(worker_pid, range(8), n_workers=2))
+
+        assert os.getpid() not in first
+        assert second == first
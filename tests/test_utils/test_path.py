@@ -1,76 +1,84 @@
 import os
-import sys
 from pathlib import Path
 from typing import Generator
 from unittest import mock
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-sys.path.append(os.path.realpath(f"{dir_path}/../../../turtwig"))
-
-
-from turtwig.futils import (generate_full_paths, list_files,
+from turtwig.futils import (generate_full_paths, generate_subdirs, list_files,
                             next_available_path, resolve_path_placeholders)
 
-PATCH_OS_WALK = "os.walk"
 PATCH_LIST_FILES = "turtwig.futils.path.list_files"
 
 
 class TestListFiles:
 
     # returns all files in a directory
-    def test_returns_all_files_in_directory(self, mocker):
-        mocker.patch(
-            PATCH_OS_WALK,
-            return_value=[
-                ("/path", ("subdir",), ("file1.txt", "file2.txt", "file$pec!al.txt")),
-                ("/path/subdir", (), ("file3.txt",)),
-            ],
-        )
+    def test_returns_all_files_in_directory(self, tmp_path):
+        (tmp_path / "subdir").mkdir()
+        for name in ["file1.txt", "file2.txt", "file$pec!al.txt", "subdir/file3.txt"]:
+            (tmp_path / name).touch()
 
-        result = list(list_files("/path"))
+        result = list_files(str(tmp_path))
         expected = [
-            "/path/file1.txt",
-            "/path/file2.txt",
-            "/path/file$pec!al.txt",
-            "/path/subdir/file3.txt",
+            str(tmp_path / "file1.txt"),
+            str(tmp_path / "file2.txt"),
+            str(tmp_path / "file$pec!al.txt"),
+            str(tmp_path / "subdir" / "file3.txt"),
         ]
-        assert result == expected
+        assert sorted(result) == sorted(expected)
+
+    # files in a directory are listed before files in its subdirectories
+    def test_lists_files_before_subdirectories(self, tmp_path):
+        (tmp_path / "a").mkdir()
+        (tmp_path / "a" / "nested.txt").touch()
+        (tmp_path / "z.txt").touch()
+
+        result = list_files(str(tmp_path))
+        assert result == [str(tmp_path / "z.txt"), str(tmp_path / "a" / "nested.txt")]
 
     # empty directory returns no files
-    def test_empty_directory_returns_no_files(self, mocker):
-        mocker.patch(PATCH_OS_WALK, return_value=[("/empty_path", (), ())])
+    def test_empty_directory_returns_no_files(self, tmp_path):
+        result = list(list_files(str(tmp_path)))
+        assert result == []
 
-        result = list(list_files("/empty_path"))
+    # missing directory returns no files, like os.walk
+    def test_missing_directory_returns_no_files(self, tmp_path):
+        result = list_files(str(tmp_path / "missing"))
         assert result == []
 
     # directory with only subdirectories returns no files
-    def test_directory_with_only_subdirectories_returns_no_files(self, mocker):
-        mocker.patch(
-            PATCH_OS_WALK,
-            return_value=[
-                ("/path", ("subdir1", "subdir2"), ()),
-                ("/path/subdir1", (), ()),
-                ("/path/subdir2", (), ()),
-            ],
-        )
+    def test_directory_with_only_subdirectories_returns_no_files(self, tmp_path):
+        (tmp_path / "subdir1").mkdir()
+        (tmp_path / "subdir2").mkdir()
 
-        result = list(list_files("/path"))
+        result = list(list_files(str(tmp_path)))
         expected = []
         assert list(result) == expected
 
     # handles directories with hidden files
-    def test_handles_directories_with_hidden_files(self, mocker):
-        mocker.patch(
-            PATCH_OS_WALK,
-            return_value=[
-                ("/path", ("subdir",), ("file1.txt", ".hidden_file", "file2.txt")),
-                ("/path/subdir", (), ("file3.txt",)),
-            ],
+    def test_handles_directories_with_hidden_files(self, tmp_path):
+        (tmp_path / "subdir").mkdir()
+        for name in ["file1.txt", ".hidden_file", "file2.txt", "subdir/file3.txt"]:
+            (tmp_path / name).touch()
+
+        result = list_files(str(tmp_path))
+        expected = [
+            str(tmp_path / "file1.txt"),
+            str(tmp_path / "file2.txt"),
+            str(tmp_path / "subdir" / "file3.txt"),
+        ]
+        assert sorted(result) == sorted(expected)
+        assert str(tmp_path / ".hidden_file") in list_files(
+            str(tmp_path), list_hidden=True
         )
 
-        result = list(list_files("/path"))
-        expected = ["/path/file1.txt", "/path/file2.txt", "/path/subdir/file3.txt"]
-        assert result == expected
+    # symlinked directories are not followed
+    def test_does_not_follow_symlinked_directories(self, tmp_path):
+        (tmp_path / "real").mkdir()
+        (tmp_path / "real" / "file.txt").touch()
+        (tmp_path / "link").symlink_to(tmp_path / "real", target_is_directory=True)
+
+        result = list_files(str(tmp_path))
+        assert result == [str(tmp_path / "real" / "file.txt")]
 
 
 class TestGenerateFullPaths:
@@ -112,6 +120,30 @@ class TestGenerateFullPaths:
         result = list(generate_full_paths(root, mock_path_generator))
         assert result == expected_paths
 
+    # handles root with a trailing separator and Path roots
+    def test_handles_trailing_separator_and_path_root(self):
+        def mock_path_generator(root):
+            return ["file1.txt"]
+
+        assert list(generate_full_paths("/home/user/", mock_path_generator)) == [
+            "/home/user/file1.txt"
+        ]
+        assert list(generate_full_paths("/", mock_path_generator)) == ["/file1.txt"]
+        assert list(generate_full_paths(Path("/home"), mock_path_generator)) == [
+            "/home/file1.txt"
+        ]
+
+    # absolute generated paths replace root, as with os.path.join
+    def test_absolute_paths_match_os_path_join(self):
+        def mock_path_generator(root):
+            return ["/abs/file1.txt", "file2.txt"]
+
+        result = list(generate_full_paths("/home/user", mock_path_generator))
+        assert result == [
+            os.path.join("/home/user", path) for path in mock_path_generator(None)
+        ]
+        assert result == ["/abs/file1.txt", "/home/user/file2.txt"]
+
     # ensures generator is lazy and does not compute paths upfront
     def test_lazy_generation(self):
         def mock_path_generator(root):
@@ -129,6 +161,28 @@ class TestGenerateFullPaths:
         assert list(result) == expected_paths
 
 
+class TestGenerateSubdirs:
+
+    # yields full paths of subdirectories only, skipping files
+    def test_yields_only_subdirectories(self, tmp_path):
+        (tmp_path / "patient_1").mkdir()
+        (tmp_path / "patient_2").mkdir()
+        (tmp_path / "notes.txt").touch()
+
+        result = sorted(generate_subdirs(tmp_path))
+
+        assert result == [str(tmp_path / "patient_1"), str(tmp_path / "patient_2")]
+
+    # ensures directory is scanned lazily
+    def test_lazy_generation(self, tmp_path):
+        (tmp_path / "patient_1").mkdir()
+
+        result = generate_subdirs(tmp_path)
+
+        assert isinstance(result, Generator)
+        assert list(result) == [str(tmp_path / "patient_1")]
+
+
 class TestResolvePathPlaceholders:
 
     # Resolves placeholders correctly for simple path patterns with single-level directories
@@ -265,28 +319,38 @@ class TestNextAvailablePath:
         assert result == Path("/test/path/file-1")
 
     # Returns path with incremented suffix when previous suffixed paths exist
-    def test_incremented_suffix_for_existing_paths(self, mocker):
-        # Mock os.path.exists to simulate existing files
-        mocker.patch(
-            "os.path.exists",
-            side_effect=lambda x: x in {"file.txt", "file-0.txt", "file-1.txt"},
-        )
+    def test_incremented_suffix_for_existing_paths(self, tmp_path):
+        for name in ["file.txt", "file-0.txt", "file-1.txt"]:
+            (tmp_path / name).touch()
+
+        result = next_available_path(tmp_path / "file.txt")
+
+        assert result == tmp_path / "file-2.txt"
+
+    # Handles existing paths without file extension
+    def test_handles_existing_file_without_extension(self, tmp_path):
+        for name in ["file", "file-1"]:
+            (tmp_path / name).touch()
+
+        result = next_available_path(str(tmp_path / "file"))
+
+        assert result == tmp_path / "file-2"
 
-        # Call the function with a path that already exists
-        result = next_available_path("file.txt")
+    # Lists the parent directory once instead of checking each suffix
+    def test_lists_parent_directory_once(self, tmp_path, mocker):
+        for i in range(1, 50):
+            (tmp_path / f"file-{i}.txt").touch()
+        (tmp_path / "file.txt").touch()
+        exists_spy = mocker.spy(os.path, "exists")
 
-        # Assert that the result is the next available path
-        assert result == Path("file-2.txt")
+        result = next_available_path(tmp_path / "file.txt")
 
-    # Handles paths with file extensions correctly
-    def test_handles_existing_file_without_extension(self):
-        # Mock os.path.exists to simulate existing files
-        with mock.patch("os.path.exists") as mock_exists:
-            # Simulate that 'file.txt' and 'file-1.txt' exist
-            mock_exists.side_effect = lambda path: path in ["file", "file-1"]
+        assert result == tmp_path / "file-50.txt"
+        assert exists_spy.call_count == 1
 
-            # Call the function with a path that has an extension
-            result = next_available_path("file")
+    # Relative paths are resolved against the current directory
+    def test_relative_path(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "file.txt").touch()
 
-            # Assert that the function returns the next available path with the correct extension
-            assert result == Path("file-2")
+        assert next_available_path("file.txt") == Path("file-1.txt")
@@ -1,11 +1,4 @@
-import os
-import sys
-
-dir_path = os.path.dirname(os.path.realpath(__file__))
-sys.path.append(os.path.realpath(f"{dir_path}/../../../turtwig"))
-
-
-from turtwig.futils.sequence import growby, growby_fs
+from turtwig.futils.sequence import growby, growby_fs, transform_nth
 
 
 class TestGrowby:
@@ -48,3 +41,19 @@ class TestGrowbyFs:
         result = list(growby_fs(fs, init))
 
         assert result == [None, 1, 2]
+
+
+class TestTransformNth:
+
+    # Only the nth element is transformed, the rest pass through in order
+    def test_transforms_only_nth_element(self):
+
+        result = list(transform_nth(2, str, range(5)))
+
+        assert result == [0, 1, "2", 3, 4]
+
+    # Indices outside the sequence leave it unchanged
+    def test_index_outside_sequence(self):
+
+        assert list(transform_nth(5, str, [1, 2])) == [1, 2]
+        assert list(transform_nth(-1, str, [1, 2])) == [1, 2]
@@ -1,10 +1,3 @@
-import os
-import sys
-
-dir_path = os.path.dirname(os.path.realpath(__file__))
-sys.path.append(os.path.realpath(f"{dir_path}/../../../../turtwig"))
-
-
 from turtwig.futils.string import capture_placeholders, placeholder_matches
 
 
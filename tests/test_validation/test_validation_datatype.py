@@ -1,14 +1,9 @@
-import os
-import sys
 from typing import Annotated
 
 import numpy as np
 import pytest
 from pydantic import ValidationError, validate_call
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-sys.path.append(os.path.realpath(f"{dir_path}/../../../turtwig"))
-
 from turtwig.validation import NumpyArrayAnnotation
 
 
@@ -78,3 +73,40 @@ class TestNumpyArrayAnnotation:
             func(np.array([[[1, 2, 3, "a"]]]))
         with pytest.raises(ValidationError):
             func(np.array([[1, 2, 3, True], [4, 4, 5, 6.0]]))
+
+    # Object arrays are still checked element by element
+    def test_object_array(self):
+        @validate_call()
+        def func(arr: Annotated[np.ndarray, NumpyArrayAnnotation[np.int64]]):
+            return arr
+
+        func(np.array([np.int64(1), np.int64(2)], dtype=object))
+
+        with pytest.raises(ValidationError):
+            func(np.array([np.int64(1), "a"], dtype=object))
+
+    # Non-contiguous object arrays are checked without copying
+    def test_non_contiguous_object_array(self):
+        @validate_call()
+        def func(arr: Annotated[np.ndarray, NumpyArrayAnnotation[np.int64]]):
+            return arr
+
+        arr = np.array([np.int64(i) for i in range(12)], dtype=object).reshape(3, 4)
+        func(arr.T)
+
+        arr[2, 3] = "a"
+        with pytest.raises(ValidationError):
+            func(arr.T)
+
+    # Empty arrays of any dtype pass typed validation
+    def test_empty_array(self):
+        @validate_call()
+        def func(arr: Annotated[np.ndarray, NumpyArrayAnnotation[np.int64]]):
+            return arr
+
+        func(np.array([], dtype=np.float64))
+
+    # Subscripting with the same type returns the same annotation class
+    def test_typed_annotation_is_reused(self):
+        assert NumpyArrayAnnotation[np.int64] is NumpyArrayAnnotation[np.int64]
+        assert NumpyArrayAnnotation[np.int64] is not NumpyArrayAnnotation[np.float64]
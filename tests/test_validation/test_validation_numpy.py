@@ -1,14 +1,9 @@
-import os
-import sys
 from typing import Annotated
 
 import numpy as np
 import pytest
 from pydantic import AfterValidator, ValidationError, validate_call
 
-dir_path = os.path.dirname(os.path.realpath(__file__))
-sys.path.append(os.path.realpath(f"{dir_path}/../../../turtwig"))
-
 from turtwig.validation import NumpyArrayAnnotation, is_ndim
 
 
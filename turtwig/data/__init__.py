@@ -6,7 +6,7 @@ from .dicom import (compute_dataset_stats, load_all_masks,
                     load_all_patient_scans, load_all_volumes, load_mask,
                     load_patient_scan, load_roi_names, load_volume,
                     purge_dicom_dir)
-from .h5 import dict_from_h5, dict_to_h5
+from .h5 import CompressedPayload, LazyDataset, dict_from_h5, dict_to_h5
 from .numpy import (bounding_box_3d, crop_to_bbox_3d, make_isotropic,
                     map_interval, z_score_scale)
 
@@ -27,4 +27,6 @@ __all__ = [
     "crop_to_bbox_3d",
     "dict_to_h5",
     "dict_from_h5",
+    "CompressedPayload",
+    "LazyDataset",
 ]
@@ -3,9 +3,10 @@ Set of methods to load and save DICOM files
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from pathlib import Path
-from typing import Annotated, Final, Iterable, Iterator
+from typing import Any, Callable, Final, Iterable, Iterator, Sequence
 
 import numpy as np
 import pydicom as dicom
@@ -14,15 +15,12 @@ import toolz as tz
 import toolz.curried as curried
 from fn import _
 from loguru import logger
-from pydantic import AfterValidator, validate_call
+from pydantic import validate_call
 from tqdm import tqdm
 
-from turtwig.validation.datatype import NumpyArrayAnnotation
-
-from ..futils import (curry, generate_full_paths, list_files,
-                      merge_with_reduce, rename_key, star, starfilter,
+from ..futils import (curry, generate_subdirs, list_files, pmap, starfilter,
                       transform_nth)
-from ..validation import DicomDict, MaskDict, NumpyArrayAnnotation, is_ndim
+from ..validation import DicomDict, MaskDict
 
 # SOP Class UIDs for different types of DICOM files
 # https://dicom.nema.org/dicom/2013/output/chtml/part04/sect_B.5.html
@@ -31,26 +29,26 @@ RT_STRUCTURE_SET: Final[str] = "1.2.840.10008.5.1.4.1.1.481.3"
 RT_DOSE: Final[str] = "1.2.840.10008.5.1.4.1.1.481.2"
 RT_PLAN: Final[str] = "1.2.840.10008.5.1.4.1.1.481.5"
 
+# File types kept by ``purge_dicom_dir``
+_PURGE_KEEP_UIDS: Final[frozenset[str]] = frozenset({CT_IMAGE, RT_STRUCTURE_SET})
+
 
 # ============ Helper functions ============
 
 
-@validate_call()
-def _flip_array(
-    array: Annotated[np.ndarray, NumpyArrayAnnotation, AfterValidator(is_ndim(ndim=3))]
-) -> np.ndarray:
+# Helpers skip validate_call, the public functions calling them validate inputs
+def _flip_array(array: np.ndarray) -> np.ndarray:
     """
     Flip on width and depth axes given array of shape (H, W, D)
 
     Assuming LPS orientation where L axis is right to left, flipping
     along width and depth axes makes the width increase from left to right
     and depth from top to bottom.
+
+    Returns a view with negative strides, no data is copied.
     """
-    return tz.pipe(
-        array,
-        curry(np.flip)(axis=-1),  # Flip depth to be top-down in ascending order
-        curry(np.flip)(axis=1),  # Flip width from right->left to left->right
-    )
+    # Flip width from right->left to left->right, depth to be top-down in ascending order
+    return array[:, ::-1, ::-1]
 
 
 @curry
@@ -63,19 +61,31 @@ def _standardise_roi_name(name: str) -> str:
     return name.strip().lower().replace(" ", "_")
 
 
-def _dicom_slice_order(dicom_file: dicom.Dataset) -> np.ndarray:
+def _parse_dicom_date(value: str) -> date:
+    """
+    Return date from DICOM DA string "YYYYMMDD", or legacy "YYYY.MM.DD"
+    """
+    digits = value.replace(".", "")
+    return date(int(digits[:4]), int(digits[4:6]), int(digits[6:8]))
+
+
+def _sort_by_slice_order(dicom_files: Iterable[dicom.Dataset]) -> list[dicom.Dataset]:
     """
-    Return slice order of input DICOM slice within its volume
+    Return ``dicom_files`` sorted by slice order within their volume
 
-    Computes the projection dot(IPP, cross(IOP, IOP)), where IPP is the Image
-    Position (Patient) and IOP is the Image Orientation (Patient). See
+    Slice order is the projection dot(IPP, cross(IOP, IOP)), where IPP is the
+    Image Position (Patient) and IOP is the Image Orientation (Patient). See
     https://blog.redbrickai.com/blog-posts/introduction-to-dicom-coordinate
     """
-    return tz.pipe(
-        np.array(dicom_file.ImageOrientationPatient),
-        lambda iop: np.cross(iop[:3], iop[3:]),
-        lambda normal: np.dot(np.array(dicom_file.ImagePositionPatient), normal),
-    )
+    dicom_files = list(dicom_files)
+    if not dicom_files:
+        return []
+
+    # Compute every slice's key in one vectorised pass, then sort the floats
+    iop = np.array([d.ImageOrientationPatient for d in dicom_files], dtype=np.float64)
+    ipp = np.array([d.ImagePositionPatient for d in dicom_files], dtype=np.float64)
+    order = np.einsum("ij,ij->i", ipp, np.cross(iop[:, :3], iop[:, 3:]))
+    return [dicom_files[i] for i in np.argsort(order, kind="stable")]
 
 
 def _get_uniform_spacing(
@@ -84,51 +94,92 @@ def _get_uniform_spacing(
     """
     Return spacings from ``dicom_files`` if they are the same across all DICOM files, else None
     """
-    # Check that each spacing in each axis is the same
-    is_uniform = lambda spacings: all(
-        [
-            all([spacing == spacings[:, axis][0] for spacing in spacings[:, axis]])
-            for axis in range(spacings.shape[1])
-        ]
-    )
     return tz.pipe(
         dicom_files,
         curried.map(
-            lambda dicom_file: [float(spacing) for spacing in dicom_file.PixelSpacing]
-            + [float(dicom_file.SliceThickness)],
+            lambda dicom_file: [*dicom_file.PixelSpacing, dicom_file.SliceThickness]
         ),
         list,
+        lambda spacings: np.asarray(spacings, dtype=np.float64).reshape(-1, 3),
+        # Uniform if every row equals the first, compared in one vectorised pass
         lambda spacings: (
-            tuple(spacings[0]) if spacings and is_uniform(np.array(spacings)) else None
+            tuple(spacings[0].tolist())
+            if spacings.size and (spacings == spacings[0]).all()
+            else None
         ),
     )  # type: ignore
 
 
-@validate_call()
-def _get_dicom_slices(dicom_path: str | Path) -> Iterator[dicom.Dataset]:
+def _read_sop_class_uid(path: str) -> str | None:
     """
-    Return all DICOM files in ``dicom_path`` containing .dcm files
+    Return SOPClassUID of DICOM file at ``path`` or None if missing, reading only that tag
+    """
+    return getattr(
+        dicom.dcmread(
+            path, force=True, stop_before_pixels=True, specific_tags=["SOPClassUID"]
+        ),
+        "SOPClassUID",
+        None,
+    )
+
+
+def _list_dicom_files(dicom_path: str | Path) -> tuple[str, ...]:
+    """
+    Return paths of all .dcm files in ``dicom_path``, searching through subdirectories
     """
     return tz.pipe(
         dicom_path,
         list_files,
         curried.filter(_.call("endswith", ".dcm")),
-        curried.map(lambda fname: dicom.dcmread(fname, force=True)),
+        tuple,
     )  # type: ignore
 
 
-@validate_call()
-def _get_ct_image_slices(dicom_path: str | Path) -> Iterable[dicom.Dataset]:
+@curry
+def _thread_map(func: Callable[[Any], Any], items: Sequence[Any]) -> list[Any]:
     """
-    Return all CT image slices from ``dicom_path`` in slice order
+    Return ``func`` applied to each of ``items`` using threads, in order
+
+    Unlike ``pmap(..., executor="thread")``, the pool only lives for this
+    call. pathos caches pools per process, and a process worker forked after
+    its parent used a thread pool inherits the cached pool without its threads,
+    so ``pmap`` in that worker never returns.
+    """
+    if not items:
+        return []
+    with ThreadPoolExecutor() as executor:
+        return list(executor.map(func, items))
+
+
+def _get_dicom_slices(
+    dicom_path: str | Path, dicom_files: tuple[str, ...] | None = None
+) -> list[dicom.Dataset]:
+    """
+    Return all DICOM files in ``dicom_path`` containing .dcm files
+
+    ``dicom_files`` are the .dcm paths already listed from ``dicom_path``,
+    listed here if None. Large elements (i.e. pixel data) are deferred and
+    only read from disk when accessed.
     """
     return tz.pipe(
-        dicom_path,
-        _get_dicom_slices,
+        _list_dicom_files(dicom_path) if dicom_files is None else dicom_files,
+        # Reading is I/O bound, overlap file reads across threads
+        _thread_map(lambda fname: dicom.dcmread(fname, force=True, defer_size="1 KB")),
+    )  # type: ignore
+
+
+def _get_ct_image_slices(
+    dicom_path: str | Path, dicom_files: tuple[str, ...] | None = None
+) -> Iterable[dicom.Dataset]:
+    """
+    Return all CT image slices from ``dicom_path`` in slice order, see ``_get_dicom_slices``
+    """
+    return tz.pipe(
+        _get_dicom_slices(dicom_path, dicom_files),
         curried.filter(_dicom_type_is(uid=CT_IMAGE)),
         # Some slice are not part of the volume (have thickness = 0)
-        curried.filter(lambda dicom_file: float(dicom_file.SliceThickness) > 0),
-        curried.sorted(key=_dicom_slice_order),
+        curried.filter(lambda dicom_file: dicom_file.SliceThickness > 0),
+        _sort_by_slice_order,
     )  # type: ignore
 
 
@@ -139,27 +190,28 @@ def _load_roi_mask(
     rt_struct: rt_utils.RTStruct,
 ) -> np.ndarray | None:
     """
-    Return ROI mask given ``name`` in ``rt_struct``, else None if exception occurs
+    Return boolean ROI mask given ``name`` in ``rt_struct``, else None if exception occurs
 
     Just a functional wrapper around rt_struct.get_roi_mask_by_name
     """
-    return rt_struct.get_roi_mask_by_name(name)
+    # Masks are binary, 1 byte per voxel instead of e.g. 8 for int64
+    return rt_struct.get_roi_mask_by_name(name).astype(np.bool_, copy=False)
 
 
-@validate_call()
-def _load_rt_structs(dicom_path: str | Path) -> Iterator[rt_utils.RTStruct]:
+def _load_rt_structs(
+    dicom_path: str | Path, dicom_files: tuple[str, ...] | None = None
+) -> Iterator[rt_utils.RTStruct]:
     """
     Create list of RTStructBuilder from DICOM RT struct file in `dicom_path`
+
+    ``dicom_files`` are the .dcm paths already listed from ``dicom_path``,
+    listed here if None. Each RTStruct holds its whole CT series in memory,
+    so callers read them once and pass them down rather than reloading.
     """
     return tz.pipe(
-        dicom_path,
-        list_files,
-        curried.filter(_.call("endswith", ".dcm")),
-        curried.filter(
-            lambda path: _dicom_type_is(
-                dicom.dcmread(path, force=True), RT_STRUCTURE_SET
-            )
-        ),
+        _list_dicom_files(dicom_path) if dicom_files is None else dicom_files,
+        # Only SOPClassUID is needed to find RT structs, skip parsing e.g. CT slices
+        curried.filter(lambda path: _read_sop_class_uid(path) == RT_STRUCTURE_SET),
         curried.map(
             lambda rt_struct_path: (
                 rt_utils.RTStructBuilder.create_from(
@@ -171,6 +223,95 @@ def _load_rt_structs(dicom_path: str | Path) -> Iterator[rt_utils.RTStruct]:
     )  # type: ignore
 
 
+def _load_volume_from_slices(dicom_slices: list[dicom.Dataset]) -> np.ndarray | None:
+    """
+    Return volume in HU from CT ``dicom_slices`` in slice order, see ``load_volume``
+
+    Each slice in ``dicom_slices`` is replaced with None once copied.
+    """
+    if not dicom_slices:
+        return None
+
+    # Allocate the volume once and fill slice by slice instead of stacking
+    # a list of per-slice arrays, which would need a second full-size copy
+    height, width = dicom_slices[0].pixel_array.shape
+    n_slices = len(dicom_slices)
+    volume = np.empty((height, width, n_slices), dtype=np.float64)
+    for i in range(n_slices):
+        # Release each dataset once copied so only one slice's pixel data
+        # is held in memory at a time
+        d_slice, dicom_slices[i] = dicom_slices[i], None  # type: ignore
+        # Write already flipped on width and depth (see ``_flip_array``), so
+        # the volume is C-contiguous. Convert to HU scale, depth on last axis
+        out = volume[:, ::-1, n_slices - 1 - i]
+        np.multiply(d_slice.pixel_array, d_slice.RescaleSlope, out=out)
+        out += d_slice.RescaleIntercept
+
+    return volume
+
+
+@logger.catch()
+def _load_mask(
+    dicom_path: str | Path, dicom_files: tuple[str, ...] | None = None
+) -> MaskDict | None:
+    """
+    Return masks from RT struct file in ``dicom_path``, see ``load_mask``
+
+    ``dicom_files`` are the .dcm paths already listed from ``dicom_path``,
+    listed here if None.
+    """
+    rt_struct = list(_load_rt_structs(dicom_path, dicom_files))
+    if rt_struct == []:
+        raise ValueError(f"No RT struct file found in {dicom_path}")
+    elif len(rt_struct) != 1:
+        logger.warning(
+            f"Multiple RT struct files found! Using the first one at {rt_struct[0]}..."
+        )
+
+    roi_names = rt_struct[0].get_roi_names()
+
+    return tz.pipe(
+        roi_names,
+        # Each ROI is rasterised independently, overlap them across threads
+        _thread_map(_load_roi_mask(rt_struct=rt_struct[0])),
+        lambda masks: zip(roi_names, masks),
+        starfilter(lambda name, mask: mask is not None),
+        curried.map(transform_nth(1, _flip_array)),
+        curried.map(transform_nth(0, _standardise_roi_name)),
+        dict,
+    )  # type: ignore
+
+
+def _load_each_patient(
+    load: Callable[[str], Any], dicom_collection_path: str | Path, n_workers: int
+) -> Iterator[Any]:
+    """
+    Return ``load`` applied to each patient directory, skipping None results
+
+    With ``n_workers`` > 1, patients are loaded in a process pool, as DICOM
+    parsing is CPU bound. Results are still in directory order. Patients are
+    submitted ``n_workers`` at a time and the next batch starts once the
+    previous one is consumed, so at most ``n_workers`` loaded patients are held
+    in memory.
+    """
+    return tz.pipe(
+        dicom_collection_path,
+        generate_subdirs,
+        (
+            curried.map(load)
+            if n_workers == 1
+            # A single pmap over every directory would have the pool's feeder
+            # submit them all up front, piling results up unconsumed
+            else tz.compose(
+                tz.concat,
+                curried.map(pmap(load, n_workers=n_workers)),
+                curried.partition_all(n_workers),
+            )
+        ),
+        curried.filter(lambda result: result is not None),
+    )  # type: ignore
+
+
 # ============ Main functions ============
 
 
@@ -194,28 +335,10 @@ def load_volume(dicom_path: str | Path) -> np.ndarray | None:
     np.ndarray | None
         3D volume in Hounsfield units (HU) or None if no DICOM files are found
     """
-    dicom_slices = list(_get_ct_image_slices(dicom_path))
-    intercepts = [float(d_slice.RescaleIntercept) for d_slice in dicom_slices]
-    slopes = [float(d_slice.RescaleSlope) for d_slice in dicom_slices]
-
-    return tz.pipe(
-        dicom_path,
-        _get_ct_image_slices,
-        curried.map(_.pixel_array),
-        # Convert to HD scale
-        lambda slices: [
-            (slice_ * slope) + intercept
-            for slice_, intercept, slope in zip(slices, intercepts, slopes)
-        ],
-        list,
-        # put depth on last axis
-        lambda slices: np.stack(slices, axis=-1) if slices else None,
-        lambda volume: _flip_array(volume) if volume is not None else None,
-    )  # type: ignore
+    return _load_volume_from_slices(list(_get_ct_image_slices(dicom_path)))
 
 
 @validate_call()
-@logger.catch()
 def load_mask(dicom_path: str | Path) -> MaskDict | None:
     """
     Load masks of shape (H, W, D) from a folder of DICOM files in `dicom_path`
@@ -235,31 +358,10 @@ def load_mask(dicom_path: str | Path) -> MaskDict | None:
     Returns
     -------
     MaskDict | None
-        Dictionary containing the masks for each organ, or None if no
+        Dictionary containing the boolean masks for each organ, or None if no
         masks are found
     """
-    rt_struct = list(_load_rt_structs(dicom_path))
-    if rt_struct == []:
-        raise ValueError(f"No RT struct file found in {dicom_path}")
-    elif len(rt_struct) != 1:
-        logger.warning(
-            f"Multiple RT struct files found! Using the first one at {rt_struct[0]}..."
-        )
-
-    roi_names = rt_struct[0].get_roi_names()
-
-    return tz.pipe(
-        (roi_names, roi_names),
-        star(zip),
-        curried.map(
-            transform_nth(1, _load_roi_mask(rt_struct=rt_struct[0])),
-        ),
-        curried.map(tuple),
-        starfilter(lambda name, mask: mask is not None),
-        curried.map(transform_nth(1, _flip_array)),
-        curried.map(transform_nth(0, _standardise_roi_name)),
-        dict,
-    )  # type: ignore
+    return _load_mask(dicom_path)
 
 
 @validate_call()
@@ -288,7 +390,11 @@ def load_patient_scan(dicom_path: str | Path) -> DicomDict | None:
         Dictionary containing the volume, mask, and metadata, or None
         if no masks are found
     """
-    dicom_slices = list(_get_ct_image_slices(dicom_path))
+    # List the directory once for the slices and the RT struct, then read
+    # every slice once for both the metadata and the volume, pixel data is
+    # deferred until the volume is built
+    dicom_files = _list_dicom_files(dicom_path)
+    dicom_slices = list(_get_ct_image_slices(dicom_path, dicom_files))
     spacings = _get_uniform_spacing(dicom_slices)
     if not dicom_slices:
         raise ValueError(f"No DICOM files found in {dicom_path}")
@@ -296,8 +402,9 @@ def load_patient_scan(dicom_path: str | Path) -> DicomDict | None:
         raise ValueError(f"Failed to load DICOM at {dicom_path}: non-uniform spacing")
 
     d_file = dicom_slices[0]  # Get one dicom file to extract PatientID
-    volume = load_volume(dicom_path)
-    mask = load_mask(dicom_path)
+    n_slices = len(dicom_slices)
+    volume = _load_volume_from_slices(dicom_slices)
+    mask = _load_mask(dicom_path, dicom_files)
 
     if volume is None:
         raise ValueError(f"Failed to load volume from {dicom_path}")
@@ -308,22 +415,20 @@ def load_patient_scan(dicom_path: str | Path) -> DicomDict | None:
         "patient_id": d_file.PatientID,
         "volume": volume,
         "masks": mask,
-        "dimension_original": (d_file.Rows, d_file.Columns, len(dicom_slices)),
+        "dimension_original": (d_file.Rows, d_file.Columns, n_slices),
         "spacings": spacings,
         "modality": d_file.Modality,
         "manufacturer": d_file.Manufacturer,
         "scanner": d_file.ManufacturerModelName,
-        "study_date": date(
-            int(d_file.StudyDate[:-4]),
-            int(d_file.StudyDate[4:6]),
-            int(d_file.StudyDate[6:]),
-        ),
+        "study_date": _parse_dicom_date(d_file.StudyDate),
         "organ_ordering": list(mask.keys()),
     }  # type: ignore
 
 
 @validate_call()
-def load_all_volumes(dicom_collection_path: str | Path) -> Iterator[np.ndarray]:
+def load_all_volumes(
+    dicom_collection_path: str | Path, n_workers: int = 1
+) -> Iterator[np.ndarray]:
     """
     Load 3D volumes from folders of DICOM files in `dicom_collection_path`
 
@@ -336,22 +441,23 @@ def load_all_volumes(dicom_collection_path: str | Path) -> Iterator[np.ndarray]:
     ----------
     dicom_collection_path : str | Path
         Path to the directory containing directories of DICOM files
+    n_workers : int, optional
+        Number of processes loading patients in parallel, by default 1 (serial).
+        Patients are loaded ``n_workers`` at a time, so at most ``n_workers``
+        are held in memory
 
     Returns
     -------
     Iterator[np.ndarray]
         An iterator of 3D volumes
     """
-    return tz.pipe(
-        dicom_collection_path,
-        generate_full_paths(path_generator=os.listdir),
-        curried.map(load_volume),
-        curried.filter(lambda volume: volume is not None),
-    )  # type: ignore
+    return _load_each_patient(load_volume, dicom_collection_path, n_workers)
 
 
 @validate_call()
-def load_all_masks(dicom_collection_path: str | Path) -> Iterator[MaskDict]:
+def load_all_masks(
+    dicom_collection_path: str | Path, n_workers: int = 1
+) -> Iterator[MaskDict]:
     """
     Load dictionary of masks from folders of DICOM files in `dicom_collection_path`
 
@@ -365,22 +471,23 @@ def load_all_masks(dicom_collection_path: str | Path) -> Iterator[MaskDict]:
     ----------
     dicom_collection_path : str | Path
         Path to the directory containing directories of DICOM files including the RT struct file
+    n_workers : int, optional
+        Number of processes loading patients in parallel, by default 1 (serial).
+        Patients are loaded ``n_workers`` at a time, so at most ``n_workers``
+        are held in memory
 
     Returns
     -------
     Iterator[MaskDict]
         An iterator of dictionaries containing the masks for each organ
     """
-    return tz.pipe(
-        dicom_collection_path,
-        generate_full_paths(path_generator=os.listdir),
-        curried.map(load_mask),
-        curried.filter(lambda mask: mask is not None),
-    )  # type: ignore
+    return _load_each_patient(load_mask, dicom_collection_path, n_workers)
 
 
 @validate_call()
-def load_all_patient_scans(dicom_collection_path: str | Path) -> Iterator[DicomDict]:
+def load_all_patient_scans(
+    dicom_collection_path: str | Path, n_workers: int = 1
+) -> Iterator[DicomDict]:
     """
     Load DicomDicts from folders of DICOM files in `dicom_collection_path`
 
@@ -394,18 +501,17 @@ def load_all_patient_scans(dicom_collection_path: str | Path) -> Iterator[DicomD
     ----------
     dicom_collection_path : str | Path
         Path to the directory containing folders of DICOM files
+    n_workers : int, optional
+        Number of processes loading patients in parallel, by default 1 (serial).
+        Patients are loaded ``n_workers`` at a time, so at most ``n_workers``
+        are held in memory
 
     Returns
     -------
     Iterator[DicomDict]
         An iterator of DicomDict dictionaries.
     """
-    return tz.pipe(
-        dicom_collection_path,
-        generate_full_paths(path_generator=os.listdir),
-        curried.map(load_patient_scan),
-        curried.filter(lambda scan: scan is not None),
-    )  # type: ignore
+    return _load_each_patient(load_patient_scan, dicom_collection_path, n_workers)
 
 
 @validate_call()
@@ -433,11 +539,11 @@ def load_roi_names(dicom_dir: str | Path) -> Iterator[list[str]]:
     """
     return tz.pipe(
         dicom_dir,
-        generate_full_paths(path_generator=os.listdir),
+        generate_subdirs,
         curried.map(_load_rt_structs),
-        curried.map(list),
-        curried.filter(_ != []),
-        curried.map(curried.get(0)),
+        # Only the first RT struct is used, so don't parse the rest
+        curried.map(lambda rt_structs: next(iter(rt_structs), None)),
+        curried.filter(lambda rt_struct: rt_struct is not None),
         curried.map(_.call("get_roi_names")),
     )  # type: ignore
 
@@ -474,14 +580,8 @@ def purge_dicom_dir(dicom_dir: str | Path, prog_bar: bool = True) -> None:
             files, desc="Purging DICOM files", disable=not prog_bar, total=len(files)
         ),
         curried.filter(_.call("endswith", ".dcm")),
-        curried.filter(
-            lambda path: (
-                not _dicom_type_is(dicom.dcmread(path, force=True), CT_IMAGE)
-                and not _dicom_type_is(
-                    dicom.dcmread(path, force=True), RT_STRUCTURE_SET
-                )
-            )
-        ),
+        # Only SOPClassUID is needed to decide, skip reading the rest of the file
+        curried.filter(lambda path: _read_sop_class_uid(path) not in _PURGE_KEEP_UIDS),
         curried.map(os.remove),
         list,
     )
@@ -496,7 +596,8 @@ def compute_dataset_stats(
     Parameters
     ----------
     dataset : Iterable[DicomDict]
-        List of patient scans
+        Patient scans, consumed in a single pass, so a lazy iterator such as
+        ``load_all_patient_scans`` can be passed without materialising a list
 
     Returns
     -------
@@ -509,30 +610,29 @@ def compute_dataset_stats(
           - ``"manufacturer"``: Set of manufacturers for the scanners
           - ``"scanner"``: Set of scanner names
     """
-    return tz.pipe(
-        dataset,
-        curried.map(
-            curried.keyfilter(
-                lambda k: k
-                in [
-                    "volume",
-                    "spacings",
-                    "dimension_original",
-                    "manufacturer",
-                    "scanner",
-                ]
-            )
-        ),
-        curried.map(curried.update_in(keys=["volume"], func=_.shape)),
-        merge_with_reduce(
-            func=lambda x, y: [x] + [y] if not isinstance(x, list) else x + [y]
-        ),
-        curried.update_in(keys=["spacings"], func=lambda s: np.array(s).mean(axis=0)),
-        curried.update_in(
-            keys=["dimension_original"], func=lambda d: np.array(d).mean(axis=0)
-        ),
-        curried.update_in(keys=["volume"], func=lambda v: np.array(v).mean(axis=0)),
-        curried.update_in(keys=["manufacturer"], func=set),
-        curried.update_in(keys=["scanner"], func=set),
-        rename_key("volume", "dimension_actual"),
-    )  # type: ignore
+    # Keep running sums instead of collecting every value before reducing
+    n_scans = 0
+    dimension_actual = np.zeros(3, dtype=np.float64)
+    dimension_original = np.zeros(3, dtype=np.float64)
+    spacings = np.zeros(3, dtype=np.float64)
+    manufacturers: set[str] = set()
+    scanners: set[str] = set()
+
+    for scan in dataset:
+        dimension_actual += scan["volume"].shape
+        dimension_original += scan["dimension_original"]
+        spacings += scan["spacings"]
+        manufacturers.add(scan["manufacturer"])
+        scanners.add(scan["scanner"])
+        n_scans += 1
+
+    if n_scans == 0:
+        raise ValueError("Cannot compute statistics of an empty dataset")
+
+    return {
+        "dimension_original": dimension_original / n_scans,
+        "dimension_actual": dimension_actual / n_scans,
+        "spacings": spacings / n_scans,
+        "manufacturer": manufacturers,
+        "scanner": scanners,
+    }  # type: ignore
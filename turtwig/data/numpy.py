@@ -2,19 +2,24 @@
 Collection of functions to process numpy arrays
 """
 
-from typing import Annotated, Literal
+from typing import Annotated, Final, Literal
 
 import numpy as np
 import SimpleITK as sitk
 import toolz as tz
 from fn import _
 from pydantic import AfterValidator, validate_call
+from scipy import ndimage
 
 from turtwig.validation.datatype import NumpyNumber
 
-from ..futils import call_method, curry, star
+from ..futils import call_method, curry
 from ..validation import NumpyArrayAnnotation, is_ndim
 
+# Size of the boolean slabs thresholded at a time when cropping, small enough to
+# stay in cache instead of materialising the whole thresholded volume
+THRESH_SLAB_BYTES: Final[int] = 16 << 20
+
 
 @curry
 @validate_call()
@@ -22,7 +27,8 @@ def map_interval(
     array: Annotated[np.ndarray, NumpyArrayAnnotation[NumpyNumber]],
     from_range: tuple[int | float, int | float],
     to_range: tuple[int | float, int | float],
-) -> Annotated[np.ndarray, NumpyArrayAnnotation[np.float64]]:
+    dtype: type[np.floating] = np.float64,
+) -> Annotated[np.ndarray, NumpyArrayAnnotation[np.floating]]:
     """
     Map values in an ``array`` in range ``from_range`` to ``to_range``
 
@@ -31,9 +37,13 @@ def map_interval(
     array : np.ndarray
         Array with numeric elements to map
     from_range : tuple[int | float, int | float]
-        Range of values in ``array``, a tuple of (min, max) values
+        Range of values in ``array``, a tuple of (min, max) values. Raises
+        ValueError if min == max, as the range can't be scaled
     to_range : tuple[int | float, int | float]
         Range of values to map to, a tuple of (min, max) values
+    dtype : type[np.floating], optional
+        Floating point type of the result, by default ``np.float64``. Use
+        ``np.float32`` to halve memory use on large volumes
 
     Returns
     -------
@@ -46,19 +56,21 @@ def map_interval(
     >>> map_interval(a, (1, 5), (0, 1))
     array([0.  , 0.25, 0.5 , 0.75, 1.  ])
     """
-    return tz.pipe(
-        array,
-        lambda a: np.array(
-            (a - from_range[0]) / float(from_range[1] - from_range[0]), dtype=np.float64
-        ),
-        lambda arr_scaled: to_range[0] + (arr_scaled * (to_range[1] - to_range[0])),
-    )
+    if from_range[0] == from_range[1]:
+        raise ValueError(f"Cannot map from zero-width range {from_range}")
+    # Fold both ranges into a single affine map so only one output buffer is written
+    scale = (to_range[1] - to_range[0]) / float(from_range[1] - from_range[0])
+    offset = to_range[0] - from_range[0] * scale
+    mapped = np.multiply(array, scale, dtype=dtype)
+    mapped += offset
+    return mapped
 
 
 @validate_call()
 def z_score_scale(
     array: Annotated[np.ndarray, NumpyArrayAnnotation[NumpyNumber]],
-) -> Annotated[np.ndarray, NumpyArrayAnnotation[np.float64]]:
+    dtype: type[np.floating] = np.float64,
+) -> Annotated[np.ndarray, NumpyArrayAnnotation[np.floating]]:
     """
     Z-score normalise ``array`` to have mean 0 and standard deviation 1
 
@@ -68,6 +80,9 @@ def z_score_scale(
     ----------
     array : np.ndarray
         Array with numeric elements to normalise
+    dtype : type[np.floating], optional
+        Floating point type of the result, by default ``np.float64``. The
+        mean and standard deviation are always accumulated in float64
 
     Returns
     -------
@@ -81,7 +96,46 @@ def z_score_scale(
     >>> a_normed.mean(), a_normed.std()
     np.float64(0.0), np.float64(0.9999999999999999)
     """
-    return (array - array.mean()) / array.std()
+    # Two passes in float64: the variance is taken over the centred buffer that
+    # is returned anyway, rather than as E[x^2] - E[x]^2, which cancels
+    # catastrophically when the mean is large compared with the spread
+    mean = array.sum(dtype=np.float64) / array.size
+    centred = np.subtract(array, mean, dtype=np.float64)
+    flat = centred.reshape(-1)
+    std = np.sqrt(np.einsum("i,i->", flat, flat) / flat.size)
+    if dtype is np.float64:
+        centred /= std
+        return centred
+    return np.divide(centred, std, dtype=dtype)
+
+
+def _resample_isotropic(
+    array: np.ndarray,
+    spacings: list[int | float] | tuple[int | float],
+    new_size: list[int],
+    order: int,
+) -> np.ndarray:
+    """
+    Resample ``array`` onto a grid with 1 unit of spacing using ``scipy.ndimage``
+
+    Matches ``sitk.Resample``, where points up to half a voxel past the last
+    voxel take the edge value and points further out are set to 0. Values
+    agree with sitk to float rounding, but where sitk leaves residuals of
+    ~1e-16 from zero voxels this gives exactly 0, so casting the result to
+    bool can differ from casting sitk's (casting to integers does not).
+    """
+    resampled = ndimage.affine_transform(
+        array.astype(np.float32),
+        1 / np.asarray(spacings, dtype=np.float64),  # output -> input coordinates
+        output_shape=tuple(new_size),
+        order=order,
+        mode="nearest",
+        prefilter=False,
+    )
+    for axis, (old_size, old_spacing) in enumerate(zip(array.shape, spacings)):
+        outside = np.arange(new_size[axis]) / old_spacing >= old_size - 0.5
+        resampled[(slice(None),) * axis + (outside,)] = 0
+    return resampled
 
 
 @curry
@@ -135,15 +189,19 @@ def make_isotropic(
         for old_size, old_spacing, in zip(array.shape, spacings)
     ]
     old_datatype = array.dtype
+    # Separable interpolation, resample in a single call without converting
+    # to and from a sitk image
+    if method in ("nearest", "linear"):
+        return _resample_isotropic(
+            array, spacings, new_size, order=0 if method == "nearest" else 1
+        ).astype(old_datatype)
+
     return tz.pipe(
         array,
         # sitk don't work with bool datatypes in mask array
         _.call("astype", np.float32),
-        # sitk moves (H, W, D) to (D, W, H) >:( move axis here so array is (H, W, D)
-        curry(np.moveaxis)(source=1, destination=0),  # width to first axis
-        lambda arr: (
-            np.moveaxis(arr, -1, 0) if len(arr.shape) == 3 else arr
-        ),  # depth to first axis
+        # sitk reads arrays as (D, W, H) >:( reverse axes so the image is (H, W, D)
+        np.transpose,
         sitk.GetImageFromArray,
         call_method("SetOrigin", (0, 0, 0), pure=False),
         call_method("SetSpacing", spacings, pure=False),
@@ -159,15 +217,52 @@ def make_isotropic(
             arr.GetPixelID(),
         ),
         sitk.GetArrayFromImage,
-        # arr is (D, W, H) move back to (H, W, D)
-        lambda arr: (
-            np.moveaxis(arr, 0, -1) if len(arr.shape) == 3 else arr
-        ),  # move depth to last axis
-        curry(np.moveaxis)(source=1, destination=0),  # height to first axis
+        np.transpose,  # arr is (D, W, H), reverse back to (H, W, D)
         _.call("astype", old_datatype),
     )
 
 
+def _first_last_true(mask: np.ndarray) -> tuple[int, int]:
+    """
+    Return indices of the first and last True in 1D ``mask``, without an index array
+    """
+    first = int(mask.argmax())
+    if not mask[first]:
+        raise ValueError("Cannot compute bounding box of an array with no True values")
+    return first, len(mask) - 1 - int(mask[::-1].argmax())
+
+
+def _bbox_from_projections(
+    row_col: np.ndarray, depth: np.ndarray
+) -> tuple[int, int, int, int, int, int]:
+    """
+    Bounding box from the (H, W) and (D,) boolean projections of a 3D array
+    """
+    row_min, row_max = _first_last_true(np.any(row_col, axis=1))
+    col_min, col_max = _first_last_true(np.any(row_col, axis=0))
+    depth_min, depth_max = _first_last_true(depth)
+    return row_min, row_max, col_min, col_max, depth_min, depth_max
+
+
+def _thresholded_projections(
+    arr: np.ndarray, thresh: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Projections of ``arr > thresh`` onto (H, W) and (D,), computed slab by slab
+    """
+    height, width, depth = arr.shape
+    step = max(1, THRESH_SLAB_BYTES // max(1, width * depth))
+    slab = np.empty((min(step, height), width, depth), dtype=bool)
+    row_col = np.empty((height, width), dtype=bool)
+    depth_any = np.zeros(depth, dtype=bool)
+    for start in range(0, height, step):
+        chunk = arr[start : start + step]
+        above = np.greater(chunk, thresh, out=slab[: len(chunk)])
+        np.any(above, axis=2, out=row_col[start : start + step])
+        depth_any |= np.any(above, axis=(0, 1))
+    return row_col, depth_any
+
+
 @validate_call()
 def bounding_box_3d(
     arr: Annotated[np.ndarray, NumpyArrayAnnotation, AfterValidator(is_ndim(ndim=3))],
@@ -194,15 +289,8 @@ def bounding_box_3d(
     >>> bounding_box_3d(a)
     (2, 4, 3, 6, 4, 7)
     """
-    row = np.any(arr, axis=(1, 2))
-    col = np.any(arr, axis=(0, 2))
-    depth = np.any(arr, axis=(0, 1))
-
-    row_min, row_max = np.where(row)[0][[0, -1]]
-    col_min, col_max = np.where(col)[0][[0, -1]]
-    depth_min, depth_max = np.where(depth)[0][[0, -1]]
-
-    return row_min, row_max, col_min, col_max, depth_min, depth_max
+    # Rows and columns share one projection, so the volume is only read twice
+    return _bbox_from_projections(np.any(arr, axis=2), np.any(arr, axis=(0, 1)))
 
 
 @curry
@@ -227,13 +315,11 @@ def crop_to_bbox_3d(
     np.ndarray
         Cropped 3D array to its bounding box
     """
-    return tz.pipe(
-        arr,
-        (_ > thresh) if thresh is not None else tz.identity,
-        bounding_box_3d,
-        star(
-            lambda rmin, rmax, cmin, cmax, zmin, zmax: arr[
-                :, rmin:rmax, cmin:cmax, zmin:zmax
-            ]
-        ),
+    # Threshold in slabs rather than building a boolean copy of the volume
+    rmin, rmax, cmin, cmax, zmin, zmax = (
+        bounding_box_3d(arr)
+        if thresh is None
+        else _bbox_from_projections(*_thresholded_projections(arr, thresh))
     )
+    # Bounding box limits are inclusive
+    return arr[rmin : rmax + 1, cmin : cmax + 1, zmin : zmax + 1]
@@ -4,11 +4,11 @@ Functional utilities.
 
 from .common import iterate_while, side_effect, star, starfilter, starmap
 from .decorator import curry
-from .dict import merge_with_reduce, rename_key
+from .dict import merge_with_reduce, merge_with_reduce_unchecked, rename_key
 from .oop import call_method
 from .parallel import pmap
-from .path import (generate_full_paths, list_files, next_available_path,
-                   resolve_path_placeholders)
+from .path import (generate_full_paths, generate_subdirs, list_files,
+                   next_available_path, resolve_path_placeholders)
 from .sequence import growby, growby_fs, transform_nth
 from .string import capture_placeholders, placeholder_matches
 
@@ -20,6 +20,7 @@ __all__ = [
     "iterate_while",
     "list_files",
     "generate_full_paths",
+    "generate_subdirs",
     "resolve_path_placeholders",
     "growby",
     "growby_fs",
@@ -29,6 +30,7 @@ __all__ = [
     "pmap",
     "next_available_path",
     "merge_with_reduce",
+    "merge_with_reduce_unchecked",
     "side_effect",
     "transform_nth",
     "rename_key",
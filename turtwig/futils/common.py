@@ -131,7 +131,12 @@ def iterate_while[
     >>> iterate_while(f, pred, 5)
     5
     """
-    return iterate_while(func, pred, func(initial)) if pred(initial) else initial
+    # Loop rather than recurse, so the iteration count isn't bounded by the
+    # recursion limit
+    value = initial
+    while pred(value):
+        value = func(value)
+    return value
 
 
 @curry
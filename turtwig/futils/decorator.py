@@ -4,11 +4,21 @@ Decorators for functions
 
 import inspect
 from functools import wraps
-from typing import Any, Callable
+from typing import Any, Callable, Final
 
-import toolz as tz
 from toolz import curry as _curry
 
+# Parameter kinds that must be filled before a curried function is evaluated.
+# Include POSITION_ONLY - if user passed these using keywords, function will
+# throw error, otherwise *args will fill in these parameters anyway
+_REQUIRED_KINDS: Final[frozenset[inspect._ParameterKind]] = frozenset(
+    {
+        inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        inspect.Parameter.KEYWORD_ONLY,
+        inspect.Parameter.POSITIONAL_ONLY,
+    }
+)
+
 
 def curry[T](func: Callable[..., T], fallback: bool = False) -> Any:
     """
@@ -68,41 +78,33 @@ def curry[T](func: Callable[..., T], fallback: bool = False) -> Any:
     >>> curry(torch.mean, fallback=True)  # not supported by inspect, use fallback!
     """
 
-    @wraps(func)
-    def toolz_curry(*args, **kwargs) -> Callable:
-        return _curry(f)(*args, **kwargs)  # type: ignore
-
+    # Signatures are read once per decoration, each function is only decorated
+    # once so caching them would only keep the functions alive
     try:
-        params = inspect.signature(func).parameters
+        signature = inspect.signature(func)
     except ValueError:
         if fallback:
-            return toolz_curry
+            # Build the ``toolz.curry`` wrapper once rather than on every call
+            return _curry(func)
         raise ValueError(
             f"Cannot extract parameters from function {func}. Use fallback=True to use toolz.curry instead."
         )
 
-    required_args = tz.pipe(
-        params,
-        tz.curried.valfilter(
-            lambda param: param.default is inspect.Parameter.empty
-            and param.kind
-            # include POSITION_ONLY - if user passed these using keywords, function
-            # will throw error, otherwise *args will fill in these parameters anyway
-            in {
-                inspect.Parameter.POSITIONAL_OR_KEYWORD,
-                inspect.Parameter.KEYWORD_ONLY,
-                inspect.Parameter.POSITIONAL_ONLY,
-            }
-        ),
-        list,
+    required_args = tuple(
+        name
+        for name, param in signature.parameters.items()
+        if param.default is inspect.Parameter.empty and param.kind in _REQUIRED_KINDS
     )
+    n_required = len(required_args)
 
     @wraps(func)
     def curried(*args, **kwargs):
-        # Evaluate only if mandatory keyword args are provided, OR args fill remaining params
-        if not (remaining_args := [k for k in required_args if k not in kwargs]) or len(
-            args
-        ) >= len(remaining_args):
+        # Evaluate only if args fill the mandatory params not given as keywords.
+        # Check the positional count first, so full positional calls skip the
+        # scan, and only scan when keywords could have filled the rest
+        if len(args) >= n_required or (
+            kwargs and len(args) >= len([k for k in required_args if k not in kwargs])
+        ):
             return func(*args, **kwargs)
 
         # Define a function instead of using lambda to let docstring etc be copied over
@@ -114,4 +116,7 @@ def curry[T](func: Callable[..., T], fallback: bool = False) -> Any:
 
         return curried_fn
 
+    # Later inspect.signature calls (e.g. validate_call stacked on top) read
+    # this directly instead of unwrapping back to ``func``
+    curried.__signature__ = signature  # type: ignore
     return curried
@@ -5,11 +5,9 @@ Functional utilities for dictionaries.
 from functools import reduce
 from typing import Annotated, Callable
 
-import toolz as tz
 from pydantic import AfterValidator, validate_call
 
 from ..validation import all_same_keys
-from .common import star
 from .decorator import curry
 
 
@@ -46,8 +44,49 @@ def merge_with_reduce[
     >>> merge_with_reduce(dicts, lambda x, y: x ** y)
     {'b': 1, 'c': 16777216}
     """
-    merge_dicts = lambda dict1, dict2: tz.merge_with(star(func), dict1, dict2)
-    return reduce(merge_dicts, dicts)
+    return merge_with_reduce_unchecked(dicts, func)
+
+
+@curry
+def merge_with_reduce_unchecked[
+    K, V, V2
+](
+    dicts: list[dict[K, V]],
+    func: Callable[[V | V2, V], V2],
+) -> (
+    dict[K, V] | dict[K, V2]
+):
+    """
+    ``merge_with_reduce`` without validating ``dicts``, for trusted callers.
+
+    Skips the pydantic validation of every dictionary and the key check,
+    roughly halving the cost for many small dictionaries. Keys missing from
+    later dictionaries raise ``KeyError``, extra keys are ignored.
+
+    Parameters
+    ----------
+    dicts : list[dict[K, V]]
+        List of dictionaries to merge, all with the same keys.
+    func : Callable[[V | V2, V], V2]
+        Reduction function taking two values and returning a single value.
+
+    Returns
+    -------
+    dict[K, V] | dict[K, V2]
+        Merged dictionary with the same keys as the input dictionaries.
+
+    Examples
+    --------
+    >>> merge_with_reduce_unchecked([{"a": 1}, {"a": 2}], lambda x, y: x + y)
+    {'a': 3}
+    """
+    if not dicts:
+        raise TypeError(
+            "merge_with_reduce_unchecked() of empty list with no initial value"
+        )
+    # Reduce each key's values directly instead of building a merged
+    # intermediate dict for every pair of input dicts
+    return {key: reduce(func, (d[key] for d in dicts)) for key in dicts[0]}
 
 
 @curry
@@ -74,6 +113,10 @@ def rename_key(old_name: str, new_name: str, dictionary: dict) -> dict:
     >>> rename_key("a", "b", {"a": 1, "c": 2})
     {'b': 1, 'c': 2}
     """
+    # Nothing to rename, copy in C instead of comparing every key. Otherwise
+    # rebuild rather than pop and reinsert, which would move the key to the end
+    if old_name not in dictionary:
+        return dict(dictionary)
     return {
         new_name if key == old_name else key: value for key, value in dictionary.items()
     }
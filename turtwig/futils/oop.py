@@ -3,17 +3,19 @@ Functions for dealing with object-oriented programming.
 """
 
 from copy import deepcopy
+from operator import methodcaller
 from typing import Callable
 
-import toolz as tz
-from fn import _
-
-from .common import side_effect
-
 
 def call_method[
     T
-](method_name: str, *args, pure: bool = True, **kwargs,) -> Callable[[T], T]:
+](
+    method_name: str,
+    *args,
+    pure: bool = True,
+    copy_fn: Callable[[T], T] = deepcopy,
+    **kwargs,
+) -> Callable[[T], T]:
     """
     Return a function that take an object, calls ``method_name`` on it, and returns the object
 
@@ -24,8 +26,14 @@ def call_method[
     pure: bool
         If True, the input object is copied before calling the method to avoid
         modifying the input object.
+    copy_fn: Callable[[T], T]
+        Function used to copy the input object if ``pure`` is True, by default
+        ``copy.deepcopy``. Pass ``copy.copy`` or the object's own clone method
+        when a shallow copy is enough, deep copies walk the whole object graph.
     args, kwargs: any
-        Arguments to pass to the method
+        Arguments to pass to the method. ``pure`` and ``copy_fn`` are keyword-only
+        and taken by ``call_method``, so they can't be passed on to the method,
+        use ``operator.methodcaller`` for methods with arguments of those names
 
     Returns
     -------
@@ -56,7 +64,20 @@ def call_method[
     >>> test is test3
     True
     """
-    return tz.compose_left(
-        deepcopy if pure else tz.identity,
-        side_effect(_.call(method_name, *args, **kwargs), pass_val=True),
-    )
+    call = methodcaller(method_name, *args, **kwargs)
+
+    # Decide on copying once here rather than on every call
+    if pure:
+
+        def call_on_copy(obj: T) -> T:
+            obj = copy_fn(obj)
+            call(obj)
+            return obj
+
+        return call_on_copy
+
+    def call_on(obj: T) -> T:
+        call(obj)
+        return obj
+
+    return call_on
@@ -2,6 +2,7 @@
 Functions for parallel processing.
 """
 
+import os
 from multiprocessing.pool import IMapIterator  # purely for typing
 from typing import Any, Callable, Generator, Literal, Optional
 
@@ -10,6 +11,17 @@ from pathos.multiprocessing import ProcessingPool, ThreadingPool
 from .decorator import curry
 
 
+def _default_chunksize(iterables: tuple[Any, ...], n_workers: Optional[int]) -> int:
+    """
+    About 4 chunks per worker if the number of elements is known, else 1
+    """
+    try:
+        n_elements = min(len(iterable) for iterable in iterables)
+    except TypeError:
+        return 1
+    return max(1, n_elements // (4 * (n_workers or os.cpu_count() or 1)))
+
+
 @curry
 def pmap(
     func: Callable[..., Any],
@@ -17,10 +29,17 @@ def pmap(
     *iterables: Any,
     n_workers: Optional[int] = None,
     executor: Literal["process", "thread"] = "process",
+    chunksize: Optional[int] = None,
 ) -> IMapIterator | Generator[Any, None, None] | Any:
     """
     Parallel map function using Process or Thread pool
 
+    Pools are kept alive and reused by later calls with the same ``n_workers``
+    and ``executor``, so workers are only started once per pool size. Process
+    workers are forked with a copy of these cached pools but not their threads,
+    so ``func`` run by process workers must not call ``pmap`` with threads
+    once the parent has.
+
     Parameters
     ----------
     func : Callable
@@ -29,6 +48,11 @@ def pmap(
         Number of workers to use. If None, the number of workers is set to the number of CPUs.
     executor : Literal["process", "thread"]
         Executor to use, process or thread workers.
+    chunksize : Optional[int]
+        Number of elements sent to a worker per task. Larger chunks cut the
+        per-task pickling and IPC cost of many small tasks. If None, iterables
+        with a length are split into about 4 chunks per worker (as
+        ``multiprocessing.Pool.map`` does), other iterables use 1.
 
     Returns
     -------
@@ -41,6 +65,8 @@ def pmap(
     [0, 1, 4, 9, 16]
     """
     Pool = ProcessingPool if executor == "process" else ThreadingPool
+    if chunksize is None:
+        chunksize = _default_chunksize((iterable, *iterables), n_workers)
     with Pool(n_workers) as pool:
-        results = pool.imap(func, iterable, *iterables)
+        results = pool.imap(func, iterable, *iterables, chunksize=chunksize)
     return results
@@ -37,12 +37,37 @@ def list_files(path: str, list_hidden: bool = False) -> list[str]:
     >>> list_files("/path/")
     ["/path/file1.txt", "/path/to/dir/file2.txt", ...]
     """
-    return [
-        os.path.join(root, file)
-        for root, _, files in os.walk(path)
-        for file in files
-        if list_hidden or not file.startswith(".")
-    ]
+    return list(_scan_files(path, list_hidden))
+
+
+def _scan_files(path: str | Path, list_hidden: bool) -> Iterator[str]:
+    """
+    Yield files in ``path``, then recursively its subdirectories, in ``os.walk`` order
+
+    Uses ``os.scandir`` directly, whose entries already carry their full path
+    and file type, instead of joining every name as ``os.walk`` output requires.
+    """
+    try:
+        with os.scandir(path) as it:
+            entries = list(it)
+    except OSError:  # Skip unreadable/missing directories like os.walk
+        return
+
+    subdirs = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if is_dir:
+            # Symlinked directories are not followed, same as os.walk
+            if not entry.is_symlink():
+                subdirs.append(entry.path)
+        elif list_hidden or not entry.name.startswith("."):
+            yield entry.path
+
+    for subdir in subdirs:
+        yield from _scan_files(subdir, list_hidden)
 
 
 @curry
@@ -58,6 +83,7 @@ def generate_full_paths(
         Root directory to concatenate onto paths
     path_generator: Callable
         Function that take ``root`` as input and returns a generator of paths
+        relative to ``root``
 
     Returns
     -------
@@ -70,7 +96,37 @@ def generate_full_paths(
     >>> list(generate_full_paths("/path", path_generator=os.listdir)
     ["/path/file1.txt", "/path/file2.txt", ...]
     """
-    return (os.path.join(root, path) for path in path_generator(root))
+    # For relative names plain concatenation is the same as os.path.join
+    # without its per-call separator handling, absolute names replace root
+    root_str = os.fspath(root)
+    base = root_str if not root_str or root_str.endswith(os.sep) else root_str + os.sep
+    return (
+        os.path.join(root_str, path) if os.path.isabs(path) else base + path
+        for path in path_generator(root)
+    )
+
+
+def generate_subdirs(root: str | Path) -> Generator[str, None, None]:
+    """
+    Lazily yield full paths of the immediate subdirectories of ``root``
+
+    Parameters
+    ----------
+    root: str | Path
+        Directory to scan
+
+    Returns
+    -------
+    Generator[str, None, None]
+        Generator of full paths of subdirectories in ``root``, files are skipped
+
+    Example
+    -------
+    >>> list(generate_subdirs("/path"))
+    ["/path/dir1", "/path/dir2", ...]
+    """
+    with os.scandir(root) as entries:
+        yield from (entry.path for entry in entries if entry.is_dir())
 
 
 @curry
@@ -99,14 +155,13 @@ def resolve_path_placeholders(path_pattern: str, placeholders: list[str]) -> lis
     if not placeholders:
         return [path_pattern]
 
-    def placeholder_in_list() -> Iterator[str]:
-        """
-        Find all placeholders in the path pattern that are in the list
-        """
-        return filter(
-            lambda placeholder: placeholder[1:-1] in placeholders,
-            re.findall(f"{{{VALID_IDENTIFIER}}}", path_pattern),
-        )
+    # Placeholders in the path pattern that are in the list, in pattern order.
+    # Same for every match, so only search the pattern once
+    captured = [
+        placeholder
+        for placeholder in re.findall(f"{{{VALID_IDENTIFIER}}}", path_pattern)
+        if placeholder[1:-1] in placeholders
+    ]
 
     return tz.pipe(
         path_pattern,
@@ -119,10 +174,7 @@ def resolve_path_placeholders(path_pattern: str, placeholders: list[str]) -> lis
         placeholder_matches(pattern=path_pattern, placeholders=placeholders),
         # Zip matches with placeholders, e.g. for path "/a/{b}/{c}" and matches ["1"], return ("{b}", "1")
         curried.map(
-            lambda matches: zip(
-                placeholder_in_list(),
-                matches,
-            ),
+            lambda matches: zip(captured, matches),
         ),
         # For each match list, get string by replacing placeholders with actual values
         curried.map(
@@ -161,7 +213,21 @@ def next_available_path(path: str | Path) -> Path:
         return Path(path)
 
     base, ext = os.path.splitext(path)
+    parent, stem = os.path.split(base)
+    try:
+        # List the directory once instead of a stat() per taken suffix
+        with os.scandir(parent or os.curdir) as entries:
+            taken = {entry.name for entry in entries}
+    except OSError:
+        taken = None
+
     counter = iterate_while(
-        _ + 1, lambda count: os.path.exists(f"{base}-{count}{ext}"), 1
+        _ + 1,
+        lambda count: (
+            f"{stem}-{count}{ext}" in taken
+            if taken is not None
+            else os.path.exists(f"{base}-{count}{ext}")
+        ),
+        1,
     )
     return Path(f"{base}-{counter}{ext}")
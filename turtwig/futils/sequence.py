@@ -2,11 +2,10 @@
 Utility functions for generating sequences
 """
 
-from itertools import islice
+from itertools import accumulate, chain, islice
 from typing import Callable, Iterable, Iterator
 
 import toolz as tz
-import toolz.curried as curried
 
 from .decorator import curry
 
@@ -42,7 +41,7 @@ def growby[
 
 
 @curry
-def growby_fs[T, R](funcs: Callable[[T | R], R], init: T) -> Iterable[T | R]:
+def growby_fs[T, R](funcs: Iterable[Callable[[T | R], R]], init: T) -> Iterable[T | R]:
     """
     Grow a sequence by applying list of functions to the last element of the current sequence
 
@@ -51,7 +50,7 @@ def growby_fs[T, R](funcs: Callable[[T | R], R], init: T) -> Iterable[T | R]:
 
     Parameters
     ----------
-    funcs : Callable
+    funcs : Iterable[Callable]
         List of functions to be called on the last element of the sequence
     init: any
         Initial value of the sequence
@@ -65,14 +64,22 @@ def growby_fs[T, R](funcs: Callable[[T | R], R], init: T) -> Iterable[T | R]:
     Examples
     --------
     >>> fs = [lambda x: x + 1, lambda x: x * 2, lambda x: x ** 2]
-    >>> list(growby_accum(fs, 1))
+    >>> list(growby_fs(fs, 1))
     [1, 2, 4, 16]
     """
-    return tz.pipe(
-        funcs,
-        curried.cons(init),  # [init, f1, f2, ...]
-        curried.accumulate(lambda x, f: f(x)),
-    )  # type: ignore
+    # C-level accumulate over [init, f1, f2, ...], the functions still run in
+    # Python. ``initial=`` isn't used as it treats an ``init`` of None as absent
+    return accumulate(chain((init,), funcs), lambda x, f: f(x))  # type: ignore
+
+
+def _transform_nth(n: int, func: Callable, seq: Iterable) -> Iterator:
+    # Pass the elements around the nth through in C instead of comparing indices
+    it = iter(seq)
+    yield from islice(it, n)
+    for x in it:
+        yield func(x)
+        break
+    yield from it
 
 
 @curry
@@ -99,4 +106,5 @@ def transform_nth(n: int, func: Callable, seq: Iterable) -> Iterable:
     >>> list(transform_nth(1, lambda _: 'a', [1, 2, 3]))
     [1, 'a', 3]
     """
-    return (func(x) if i == n else x for i, x in enumerate(seq))
+    # Negative indices never match, as with counting the elements up from 0
+    return _transform_nth(n, func, seq) if n >= 0 else iter(seq)
@@ -115,13 +115,11 @@ def placeholder_matches(
     ... )
     [("eye", "sp")]
     """
+    # Build and compile the regex once rather than for every string
+    regex = re.compile(capture_placeholders(pattern, placeholders, re_pattern))
     return tz.pipe(
         str_list,
-        curried.map(
-            lambda string: re.match(
-                capture_placeholders(pattern, placeholders, re_pattern), string
-            ),
-        ),
+        curried.map(regex.match),
         curried.filter(lambda match: match is not None),
         curried.map(lambda re_match: re_match.groups()),
         list,
@@ -3,6 +3,7 @@ Datatype definitions for validation.
 """
 
 from datetime import date
+from functools import cache
 from typing import Annotated, Any, Iterator, TypedDict, get_args, get_origin
 
 import h5py
@@ -69,6 +70,9 @@ class NumpyArrayAnnotation:
     >>> test([1, 3], [1, 3], [1, 3])  # error
     """
 
+    # Same type gives the same subclass, so pydantic can reuse its schema
+    @classmethod
+    @cache
     def __class_getitem__(cls, type_: type):  # type: ignore
         """
         Dynamically create a subclass of NumpyArrayAnnotation with the specified type.
@@ -87,22 +91,31 @@ class NumpyArrayAnnotation:
     def __get_pydantic_core_schema__(
         cls, source_type: Any, handler: GetCoreSchemaHandler
     ) -> CoreSchema:
+        # Resolved once per schema instead of on every validated call
+        type_ = getattr(cls, "type__", None)  # None means cls is not typed
+
         def all_are_type(arr: np.ndarray):
             if arr.ndim == 0:
                 arr = np.atleast_1d(arr)
             if (
-                not hasattr(cls, "type__")  # means cls is not typed
-                or cls.type__ is None  # type: ignore
-                or all(isinstance(i, cls.type__) for i in arr.ravel())  # type: ignore
+                type_ is None
+                or arr.size == 0
+                # Every element of a non-object array is an instance of
+                # arr.dtype.type, so check the dtype once instead of each element
+                or (not arr.dtype.hasobject and issubclass(arr.dtype.type, type_))
+                or (
+                    arr.dtype.hasobject
+                    # arr.flat iterates in place, ravel copies non-contiguous arrays
+                    and all(isinstance(i, type_) for i in arr.flat)
+                )
             ):
                 return arr
-            raise ValueError(f"All items must be of the type {cls.type__}")  # type: ignore
+            raise ValueError(f"All items must be of the type {type_}")
 
         return core_schema.json_or_python_schema(
             json_schema=core_schema.chain_schema(
                 [
                     core_schema.is_instance_schema(np.ndarray),
-                    core_schema.list_schema(),
                     core_schema.no_info_plain_validator_function(all_are_type),
                 ]
             ),
@@ -32,7 +32,11 @@ def all_same_keys(dicts: list[dict]) -> list[dict]:
     >>> test([{"a": 1, "b": 2}, {"a": 3}])  # Error, all dictionaries must have the same keys
     >>> test([{"a": 1, "b": 2}, {"a": 3, "c": 4}])  # Error, all dictionaries must have the same keys
     """
-    assert all(
-        dicts[0].keys() == d.keys() for d in dicts
-    ), "All dictionaries must have the same keys"
+    if not dicts:
+        return dicts
+    # Reuse the first keys view, dict_keys equality already rejects a size
+    # mismatch before hashing any key
+    first_keys = dicts[0].keys()
+    for d in dicts:
+        assert d.keys() == first_keys, "All dictionaries must have the same keys"
     return dicts
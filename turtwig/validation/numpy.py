@@ -42,14 +42,13 @@ def is_ndim(arr: np.ndarray, *, ndim: int | list[int] | tuple[int]) -> np.ndarra
     >>> test(np.array([1, 2, 3])) # Error, expected 2 dimensions, got 1
     >>> test(np.array([[[1, 2], [3, 4]], [[5, 6], [7, 8]]])) # Error, expected 2 dimensions, got 3
     """
+    n_dims = arr.ndim
+    # Tuple of types rather than a ``list | tuple`` union, which would be
+    # rebuilt on every call. isinstance keeps accepting int subclasses
     if isinstance(ndim, int):
-        assert (
-            len(arr.shape) == ndim
-        ), f"Expected {ndim} dimensions, got {len(arr.shape)}"
-    elif isinstance(ndim, list | tuple):
-        assert (
-            len(arr.shape) in ndim
-        ), f"Expected {ndim} dimensions, got {len(arr.shape)}"
+        assert n_dims == ndim, f"Expected {ndim} dimensions, got {n_dims}"
+    elif isinstance(ndim, (list, tuple)):
+        assert n_dims in ndim, f"Expected {ndim} dimensions, got {n_dims}"
     else:
         raise TypeError(f"Expected int, list, or tuple, got {type(ndim)}")
     return arr